@@ -1,8 +1,6 @@
 """Shared utilities and clients for Project Agent."""
 
-from packages.shared.schemas.chat import ChatRequest, ChatResponse, Citation
-from packages.shared.schemas.document import Document, DocumentMetadata
-from packages.shared.schemas.inventory import InventoryRequest, InventoryResponse, InventoryFilters, InventoryItem
+from typing import Any
 
 __all__ = [
     "ChatRequest",
@@ -16,3 +14,12 @@ __all__ = [
     "InventoryItem"
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Resolve schema re-exports lazily via packages.shared.schemas."""
+    if name in __all__:
+        from packages.shared import schemas
+        value = getattr(schemas, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
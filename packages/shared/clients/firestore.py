@@ -1,10 +1,13 @@
 """Firestore client for Project Agent."""
 
+import logging
 import os
 from typing import Dict, Any, List, Optional
 from google.cloud import firestore
 from packages.shared.schemas import DocumentMetadata, InventoryFilters, InventoryResponse
 
+logger = logging.getLogger(__name__)
+
 
 class FirestoreClient:
     """Client for Firestore operations."""
@@ -17,10 +20,10 @@ class FirestoreClient:
         """Save document metadata to Firestore."""
         try:
             doc_ref = self.db.collection("documents").document(metadata.id)
-            doc_ref.set(metadata.dict())
+            doc_ref.set(metadata.model_dump(exclude_none=True))
             return metadata.id
-        except Exception as e:
-            print(f"Error saving document to Firestore: {e}")
+        except Exception:
+            logger.exception("Error saving document %s to Firestore", metadata.id)
             raise
     
     async def get_document(self, doc_id: str) -> Optional[DocumentMetadata]:
@@ -30,10 +33,10 @@ class FirestoreClient:
             doc = doc_ref.get()
             
             if doc.exists:
-                return DocumentMetadata(**doc.to_dict())
+                return DocumentMetadata.from_firestore(doc.to_dict())
             return None
-        except Exception as e:
-            print(f"Error getting document from Firestore: {e}")
+        except Exception:
+            logger.exception("Error getting document %s from Firestore", doc_id)
             raise
     
     async def save_document_metadata(self, metadata: DocumentMetadata):
@@ -93,6 +96,6 @@ class FirestoreClient:
                 documents.append(doc_data)
             
             return documents
-        except Exception as e:
-            print(f"Error querying documents by category: {e}")
+        except Exception:
+            logger.exception("Error querying documents by category %s", category)
             return []
\ No newline at end of file
@@ -250,7 +250,7 @@ class RBACClient:
             return False
         
         # Super admin has access to everything
-        if user.role == UserRole.SUPER_ADMIN:
+        if user.role is UserRole.SUPER_ADMIN:
             return True
         
         # Get document to find its project
@@ -282,9 +282,9 @@ class RBACClient:
         return TenantContext(
             user_id=user.id,
             user_email=user.email,
-            user_role=user.role.value,
-            client_ids=user.client_ids,
-            project_ids=user.project_ids
+            user_role=user.role,
+            client_ids=frozenset(user.client_ids),
+            project_ids=frozenset(user.project_ids)
         )
     
     # ============================================================================
@@ -340,7 +340,7 @@ class RBACClient:
         if not user:
             return []
         
-        if user.role == UserRole.SUPER_ADMIN:
+        if user.role is UserRole.SUPER_ADMIN:
             # Super admin sees all projects
             return await self.list_projects()
         
@@ -359,7 +359,7 @@ class RBACClient:
         if not user:
             return []
         
-        if user.role == UserRole.SUPER_ADMIN:
+        if user.role is UserRole.SUPER_ADMIN:
             # Super admin sees all clients
             return await self.list_clients()
         
@@ -384,7 +384,7 @@ class RBACClient:
         if not user:
             raise AuthorizationError("User not found")
         
-        if user.role != UserRole.SUPER_ADMIN and project_id not in user.project_ids:
+        if user.role is not UserRole.SUPER_ADMIN and project_id not in user.project_ids:
             raise AuthorizationError(f"User does not have access to project {project_id}")
         
         # Query documents
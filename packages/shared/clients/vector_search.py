@@ -1,10 +1,64 @@
 """Vector Search client for Project Agent."""
 
+import functools
+import hashlib
 import os
-from typing import List, Dict, Any, Optional
+import struct
+import threading
+from typing import List, Dict, Any, Optional, Union
 from google.cloud import aiplatform
 import numpy as np
 
+_EMBEDDING_DIM = 768
+
+# SHA-256 digest unpacked as eight big-endian unsigned 32-bit integers
+_DIGEST_FORMAT = ">8I"
+_NORMALIZE_SCALE = 2.0 / (2**31 - 1)
+
+# (project, location) pairs aiplatform has already been initialized for
+_initialized_platforms: set = set()
+_init_lock = threading.Lock()
+
+
+def _init_aiplatform(project_id: Optional[str], location: str) -> None:
+    """Initialize AI Platform once per process for a project/location."""
+    key = (project_id, location)
+    if key in _initialized_platforms:
+        return
+    
+    with _init_lock:
+        if key not in _initialized_platforms:
+            aiplatform.init(project=project_id, location=location)
+            _initialized_platforms.add(key)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_index(project_id: str, location: str, index_id: str) -> aiplatform.MatchingEngineIndex:
+    """Look up a Vector Search index once per (project, location, index)."""
+    return aiplatform.MatchingEngineIndex(
+        index_name=f"projects/{project_id}/locations/{location}/indexes/{index_id}"
+    )
+
+
+def _embed_from_buffer(buf: bytes) -> List[float]:
+    """Build the demo hash embedding from already-encoded text."""
+    # Simple hash-based embedding for demo purposes
+    # In production, use a proper embedding model like text-embedding-ada-002
+    
+    # Create a deterministic hash
+    hash_bytes = hashlib.sha256(buf).digest()
+    
+    # Preallocate the 768-dimensional vector (common embedding size); the
+    # padding stays as the shared 0.0 float
+    embedding = [0.0] * _EMBEDDING_DIM
+    
+    # Reinterpret the 32-byte digest as 8 big-endian uint32s in one call
+    # and normalize each to the [-1, 1] range
+    values = struct.unpack(_DIGEST_FORMAT, hash_bytes)
+    embedding[:len(values)] = [val * _NORMALIZE_SCALE - 1.0 for val in values]
+    
+    return embedding
+
 
 class VectorSearchClient:
     """Client for Vertex AI Vector Search operations."""
@@ -15,54 +69,32 @@ class VectorSearchClient:
         self.index_id = os.getenv("VECTOR_SEARCH_INDEX_ID")
         
         # Initialize AI Platform
-        aiplatform.init(project=self.project_id, location=self.location)
+        _init_aiplatform(self.project_id, self.location)
         
         # Initialize the index if available
         if self.index_id:
             try:
-                self.index = aiplatform.MatchingEngineIndex(
-                    index_name=f"projects/{self.project_id}/locations/{self.location}/indexes/{self.index_id}"
-                )
+                self.index = _get_index(self.project_id, self.location, self.index_id)
             except Exception as e:
                 print(f"⚠️  Could not initialize vector search index: {e}")
                 self.index = None
         else:
             self.index = None
     
-    async def generate_embedding(self, text: str) -> List[float]:
+    async def generate_embedding(self, text: Union[str, bytes]) -> List[float]:
         """
         Generate embedding for text using a simple method.
         In production, this would use a proper embedding model.
         
         Args:
-            text: Input text
+            text: Input text, or its UTF-8 encoding if the caller already has it
             
         Returns:
             Embedding vector
         """
-        # Simple hash-based embedding for demo purposes
-        # In production, use a proper embedding model like text-embedding-ada-002
-        import hashlib
-        
-        # Create a deterministic hash
-        hash_obj = hashlib.sha256(text.encode())
-        hash_bytes = hash_obj.digest()
-        
-        # Convert to 768-dimensional vector (common embedding size)
-        embedding = []
-        for i in range(0, len(hash_bytes), 4):
-            # Take 4 bytes at a time and convert to float
-            if i + 3 < len(hash_bytes):
-                val = int.from_bytes(hash_bytes[i:i+4], byteorder='big')
-                # Normalize to [-1, 1] range
-                normalized = (val / (2**31 - 1)) * 2 - 1
-                embedding.append(normalized)
-        
-        # Pad or truncate to exactly 768 dimensions
-        while len(embedding) < 768:
-            embedding.append(0.0)
-        
-        return embedding[:768]
+        # Encode once; callers holding the bytes (e.g. for cache keys) pass them through
+        buf = text.encode("utf-8") if isinstance(text, str) else text
+        return _embed_from_buffer(buf)
     
     async def upsert_vector(self, vector_id: str, embedding: List[float], metadata: Dict[str, Any]) -> bool:
         """Upsert vector to vector search index."""
@@ -130,31 +162,40 @@ class VectorSearchClient:
             overlap: Overlap between chunks
             
         Returns:
-            List of text chunks
+            List of non-empty, stripped text chunks; empty if ``text`` is empty
+            or whitespace-only
         """
-        if len(text) <= chunk_size:
-            return [text]
+        # Strip once up front so leading/trailing whitespace never yields empty chunks
+        text = text.strip()
+        text_len = len(text)
+        if text_len <= chunk_size:
+            return [text] if text else []
         
         chunks = []
         start = 0
         
-        while start < len(text):
+        while start < text_len:
             end = start + chunk_size
             
             # Try to break at word boundary
-            if end < len(text):
+            if end < text_len:
                 # Find the last space before the end
                 last_space = text.rfind(' ', start, end)
                 if last_space > start:
                     end = last_space
             
-            chunk = text[start:end].strip()
+            # Only pay for strip() when the slice actually starts or ends on whitespace
+            chunk = text[start:end]
+            if chunk[:1].isspace() or chunk[-1:].isspace():
+                chunk = chunk.strip()
             if chunk:
                 chunks.append(chunk)
             
-            # Move start position with overlap
-            start = end - overlap
-            if start >= len(text):
+            # Move start position with overlap, dropping the overlap if it would
+            # not advance (a space near the window start would otherwise loop forever)
+            next_start = end - overlap
+            start = next_start if next_start > start else end
+            if start >= text_len:
                 break
         
         return chunks
@@ -1,14 +1,33 @@
 """Vision API client for Project Agent."""
 
+import asyncio
+import threading
 from google.cloud import vision
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+
+# Shared ImageAnnotatorClient (one gRPC channel per process)
+_annotator_client: Optional[vision.ImageAnnotatorClient] = None
+_annotator_client_lock = threading.Lock()
+
+
+def get_annotator_client() -> vision.ImageAnnotatorClient:
+    """Get the process-wide Vision ImageAnnotatorClient, creating it on first use."""
+    global _annotator_client
+    
+    if _annotator_client is None:
+        with _annotator_client_lock:
+            if _annotator_client is None:
+                _annotator_client = vision.ImageAnnotatorClient()
+    
+    return _annotator_client
 
 
 class VisionClient:
     """Client for Vision API operations."""
     
     def __init__(self):
-        self.client = vision.ImageAnnotatorClient()
+        self.client = get_annotator_client()
     
     async def extract_text(self, content: bytes) -> str:
         """Extract text from image using Vision API."""
@@ -16,7 +35,8 @@ class VisionClient:
         # In production, use Vision API
         try:
             image = vision.Image(content=content)
-            response = self.client.text_detection(image=image)
+            # The Vision client is blocking gRPC; run it off the event loop
+            response = await asyncio.to_thread(self.client.text_detection, image=image)
             texts = response.text_annotations
             
             if texts:
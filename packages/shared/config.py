@@ -1,60 +1,73 @@
 """Centralized configuration management for Project Agent."""
 
-import os
 from typing import Optional
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
 
+def _default_cors_origins(gcp_project: str, region: str) -> list[str]:
+    """Build the default CORS origins for a project and region."""
+    return [
+        "http://localhost:3000",
+        "https://transparent-agent-test.web.app",
+        f"https://project-agent-web-{gcp_project}.{region}.run.app"
+    ]
+
+
 class Settings(BaseSettings):
     """Application settings with validation and type safety."""
     
     # GCP Configuration
-    gcp_project: str = os.getenv("GCP_PROJECT", "transparent-agent-test")
-    region: str = os.getenv("REGION", "us-central1")
-    allowed_domain: str = os.getenv("ALLOWED_DOMAIN", "transparent.partners")
+    gcp_project: str = "transparent-agent-test"
+    region: str = "us-central1"
+    allowed_domain: str = "transparent.partners"
     
     # Storage Buckets
-    gcs_doc_bucket: str = os.getenv("GCS_DOC_BUCKET", "ta-test-docs-dev")
-    gcs_thumb_bucket: str = os.getenv("GCS_THUMB_BUCKET", "ta-test-thumbs-dev")
+    gcs_doc_bucket: str = "ta-test-docs-dev"
+    gcs_thumb_bucket: str = "ta-test-thumbs-dev"
     
     # Database
-    firestore_db: str = os.getenv("FIRESTORE_DB", "(default)")
+    firestore_db: str = "(default)"
     
     # AI Services
-    vector_index: str = os.getenv("VECTOR_INDEX", "project-agent-dev")
-    doc_ai_processor: Optional[str] = os.getenv("DOC_AI_PROCESSOR")
+    vector_index: str = "project-agent-dev"
+    doc_ai_processor: Optional[str] = None
     
     # Authentication
-    google_oauth_client_id: Optional[str] = os.getenv("GOOGLE_OAUTH_CLIENT_ID")
-    google_oauth_client_secret: Optional[str] = os.getenv("GOOGLE_OAUTH_CLIENT_SECRET")
-    admin_emails: str = os.getenv("ADMIN_EMAILS", "")
+    google_oauth_client_id: Optional[str] = None
+    google_oauth_client_secret: Optional[str] = None
+    admin_emails: str = ""
     
     # Pub/Sub
-    pubsub_topic_ingestion: str = os.getenv("PUBSUB_TOPIC_INGESTION", "project-agent-ingestion")
-    pubsub_subscription_ingestion: str = os.getenv("PUBSUB_SUBSCRIPTION_INGESTION", "project-agent-ingestion-sub")
+    pubsub_topic_ingestion: str = "project-agent-ingestion"
+    pubsub_subscription_ingestion: str = "project-agent-ingestion-sub"
     
     # Service Account
-    service_account_email: Optional[str] = os.getenv("SERVICE_ACCOUNT_EMAIL")
+    service_account_email: Optional[str] = None
     
     # API Configuration
-    api_rate_limit: int = int(os.getenv("API_RATE_LIMIT", "100"))
-    api_timeout: int = int(os.getenv("API_TIMEOUT", "30"))
+    api_rate_limit: int = 100
+    api_timeout: int = 30
     
     # Logging
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    structured_logging: bool = os.getenv("STRUCTURED_LOGGING", "true").lower() == "true"
+    log_level: str = "INFO"
+    structured_logging: bool = True
     
     # Environment
-    environment: str = os.getenv("ENVIRONMENT", "development")
-    debug: bool = os.getenv("DEBUG", "false").lower() == "true"
+    environment: str = "development"
+    debug: bool = False
     
-    # CORS
-    cors_origins: list = [
-        "http://localhost:3000",
-        "https://transparent-agent-test.web.app",
-        f"https://project-agent-web-{os.getenv('GCP_PROJECT', 'transparent-agent-test')}.{os.getenv('REGION', 'us-central1')}.run.app"
-    ]
+    # CORS; None means not configured, so the defaults are derived below.
+    # An explicitly configured empty list is kept as-is.
+    cors_origins: Optional[list[str]] = None
+    
+    @model_validator(mode="after")
+    def _fill_cors_origins(self) -> "Settings":
+        """Derive default CORS origins from the parsed project and region when unset."""
+        if self.cors_origins is None:
+            self.cors_origins = _default_cors_origins(self.gcp_project, self.region)
+        return self
     
     @property
     def is_production(self) -> bool:
@@ -1,6 +1,6 @@
 """Custom exceptions for Project Agent."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from fastapi import HTTPException, status
 
 
@@ -48,6 +48,32 @@ class ExternalServiceError(ProjectAgentException):
     pass
 
 
+# Exception type -> (HTTP status code, error tag) for handle_exception
+_EXCEPTION_STATUS_MAP: Dict[type, Tuple[int, str]] = {
+    DocumentNotFoundError: (status.HTTP_404_NOT_FOUND, "document_not_found"),
+    AuthenticationError: (status.HTTP_401_UNAUTHORIZED, "authentication_failed"),
+    AuthorizationError: (status.HTTP_403_FORBIDDEN, "authorization_failed"),
+    ValidationError: (status.HTTP_400_BAD_REQUEST, "validation_error"),
+    ProcessingError: (status.HTTP_500_INTERNAL_SERVER_ERROR, "internal_error"),
+    StorageError: (status.HTTP_500_INTERNAL_SERVER_ERROR, "internal_error"),
+    ExternalServiceError: (status.HTTP_500_INTERNAL_SERVER_ERROR, "internal_error"),
+}
+
+
+def _lookup_exception_status(exc_type: type) -> Optional[Tuple[int, str]]:
+    """Find the status entry for an exception type, falling back to its bases."""
+    entry = _EXCEPTION_STATUS_MAP.get(exc_type)
+    if entry is not None:
+        return entry
+    
+    # Subclasses of the mapped exceptions resolve via their nearest mapped base
+    for base in exc_type.__mro__[1:]:
+        entry = _EXCEPTION_STATUS_MAP.get(base)
+        if entry is not None:
+            return entry
+    return None
+
+
 def handle_exception(exc: Exception) -> HTTPException:
     """
     Convert custom exceptions to HTTP exceptions.
@@ -58,64 +84,24 @@ def handle_exception(exc: Exception) -> HTTPException:
     Returns:
         HTTPException with appropriate status code
     """
-    if isinstance(exc, DocumentNotFoundError):
-        return HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "document_not_found",
-                "message": exc.message,
-                "details": exc.details
-            }
-        )
-    
-    elif isinstance(exc, AuthenticationError):
-        return HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "error": "authentication_failed",
-                "message": exc.message,
-                "details": exc.details
-            }
-        )
-    
-    elif isinstance(exc, AuthorizationError):
+    entry = _lookup_exception_status(type(exc))
+    if entry is not None:
+        status_code, error = entry
         return HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
+            status_code=status_code,
             detail={
-                "error": "authorization_failed",
+                "error": error,
                 "message": exc.message,
                 "details": exc.details
             }
         )
     
-    elif isinstance(exc, ValidationError):
-        return HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "validation_error",
-                "message": exc.message,
-                "details": exc.details
-            }
-        )
-    
-    elif isinstance(exc, (ProcessingError, StorageError, ExternalServiceError)):
-        return HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "internal_error",
-                "message": exc.message,
-                "details": exc.details
-            }
-        )
-    
-    else:
-        # Unknown exception
-        return HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "unknown_error",
-                "message": "An unexpected error occurred",
-                "details": {"exception_type": type(exc).__name__}
-            }
-        )
-
+    # Unknown exception
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail={
+            "error": "unknown_error",
+            "message": "An unexpected error occurred",
+            "details": {"exception_type": type(exc).__name__}
+        }
+    )
@@ -0,0 +1,33 @@
+"""Per-request clock so records built in one request share a timestamp."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Iterator, Optional
+
+_REQUEST_NOW: ContextVar[Optional[datetime]] = ContextVar("request_now", default=None)
+
+
+def request_now() -> datetime:
+    """Current request's frozen time, or the wall clock outside a request.
+
+    Use as a ``default_factory`` for timestamp fields.
+    """
+    return _REQUEST_NOW.get() or datetime.now()
+
+
+@contextmanager
+def with_request_clock(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """Freeze ``request_now()`` for the duration of the block."""
+    frozen = now or datetime.now()
+    token = _REQUEST_NOW.set(frozen)
+    try:
+        yield frozen
+    finally:
+        _REQUEST_NOW.reset(token)
+
+
+async def request_clock_middleware(request, call_next):
+    """FastAPI HTTP middleware reading the clock once at request entry."""
+    with with_request_clock():
+        return await call_next(request)
@@ -1,28 +1,47 @@
-"""Shared schemas and types for Project Agent."""
-
-from .document import (
-    Document, DocumentMetadata, DocumentStatus, DocType, 
-    DocumentCategory, DocumentSubcategory, ClassificationInfo
-)
-from .chat import ChatRequest, ChatResponse, Citation
-from .admin import IngestRequest, IngestResponse, AdminAction
-from .inventory import InventoryRequest, InventoryResponse, InventoryFilters
-
-__all__ = [
-    "Document",
-    "DocumentMetadata", 
-    "DocumentStatus",
-    "DocType",
-    "DocumentCategory",
-    "DocumentSubcategory", 
-    "ClassificationInfo",
-    "ChatRequest",
-    "ChatResponse",
-    "Citation",
-    "IngestRequest",
-    "IngestResponse", 
-    "AdminAction",
-    "InventoryRequest",
-    "InventoryResponse",
-    "InventoryFilters",
-]
+"""Shared schemas and types for Project Agent.
+
+Schema modules are imported lazily on first attribute access (PEP 562) so
+that importing one schema does not build every Pydantic model in the package.
+"""
+
+import importlib
+from typing import Any
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "Document": ".document",
+    "DocumentMetadata": ".document",
+    "DocumentStatus": ".document",
+    "DocType": ".document",
+    "MediaType": ".document",
+    "DocumentCategory": ".document",
+    "DocumentSubcategory": ".document",
+    "ClassificationInfo": ".document",
+    "ChatRequest": ".chat",
+    "ChatResponse": ".chat",
+    "Citation": ".chat",
+    "IngestRequest": ".admin",
+    "IngestResponse": ".admin",
+    "AdminAction": ".admin",
+    "InventoryRequest": ".inventory",
+    "InventoryResponse": ".inventory",
+    "InventoryFilters": ".inventory",
+    "InventoryItem": ".inventory",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access and cache the attribute."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -29,6 +29,7 @@ class IngestResponse(BaseModel):
     ok: bool = Field(..., description="Success status")
     job_id: Optional[str] = Field(None, description="Processing job ID")
     count: Optional[int] = Field(None, description="Number of documents processed")
+    failed_count: Optional[int] = Field(None, description="Number of documents that failed")
     message: Optional[str] = Field(None, description="Response message")
 
 
@@ -1,12 +1,30 @@
 """Document schemas and types."""
 
+import sys
 from enum import Enum
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple, Type, TypeVar, Union
+import pydantic_core
+from pydantic_core import SchemaValidator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import TypedDict
 from datetime import datetime
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
 
-class DocumentStatus(str, Enum):
+
+class _LookupEnum(str, Enum):
+    """str Enum with a precomputed value -> member table for fast lookups."""
+    
+    @classmethod
+    def from_str(cls, value: str) -> "_LookupEnum":
+        """Look up a member by value (drop-in for ``cls(value)``)."""
+        member = _ENUM_BY_VALUE[cls].get(value)
+        if member is None:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+        return member
+
+
+class DocumentStatus(_LookupEnum):
     """Document processing status - logical workflow progression."""
     
     # === INITIAL UPLOAD PHASE ===
@@ -25,19 +43,76 @@ class DocumentStatus(str, Enum):
     PROCESSING_REQUESTED = "processing_requested"  # Admin requested AI processing
     PROCESSING = "processing"  # Currently being vectorized/processed
     PROCESSED = "processed"  # Fully processed and available for AI chat
+    INDEXED = "indexed"  # Ingested and vectorized by the ingestion worker
     
     # === ERROR STATES ===
     QUARANTINED = "quarantined"  # Removed from system due to policy violations
     FAILED = "failed"  # Processing failed, needs attention
+    
+    def can_transition_to(self, target: "DocumentStatus") -> bool:
+        """Check whether the workflow allows moving from this status to target."""
+        return bool(_ALLOWED_TRANSITIONS[self] & target._bit)
+
+
+# One bit per status; the allowed targets of each status are OR-ed into a mask
+for _index, _status in enumerate(DocumentStatus):
+    _status._bit = 1 << _index
+
 
+def _status_mask(*statuses: DocumentStatus) -> int:
+    """OR together the bits of the given statuses."""
+    mask = 0
+    for status in statuses:
+        mask |= status._bit
+    return mask
 
-class MediaType(str, Enum):
+
+_ALLOWED_TRANSITIONS: Dict[DocumentStatus, int] = {
+    DocumentStatus.UPLOADED: _status_mask(
+        DocumentStatus.REQUEST_ACCESS, DocumentStatus.AWAITING_APPROVAL,
+        DocumentStatus.APPROVED, DocumentStatus.QUARANTINED,
+    ),
+    DocumentStatus.REQUEST_ACCESS: _status_mask(
+        DocumentStatus.ACCESS_REQUESTED, DocumentStatus.QUARANTINED,
+    ),
+    DocumentStatus.ACCESS_REQUESTED: _status_mask(
+        DocumentStatus.ACCESS_GRANTED, DocumentStatus.QUARANTINED,
+    ),
+    DocumentStatus.ACCESS_GRANTED: _status_mask(
+        DocumentStatus.AWAITING_APPROVAL, DocumentStatus.APPROVED, DocumentStatus.QUARANTINED,
+    ),
+    DocumentStatus.AWAITING_APPROVAL: _status_mask(
+        DocumentStatus.APPROVED, DocumentStatus.QUARANTINED,
+    ),
+    DocumentStatus.APPROVED: _status_mask(
+        DocumentStatus.PROCESSING_REQUESTED, DocumentStatus.QUARANTINED,
+    ),
+    DocumentStatus.PROCESSING_REQUESTED: _status_mask(
+        DocumentStatus.PROCESSING, DocumentStatus.QUARANTINED,
+    ),
+    DocumentStatus.PROCESSING: _status_mask(
+        DocumentStatus.PROCESSED, DocumentStatus.INDEXED, DocumentStatus.FAILED,
+    ),
+    DocumentStatus.PROCESSED: _status_mask(DocumentStatus.QUARANTINED),
+    DocumentStatus.INDEXED: _status_mask(DocumentStatus.QUARANTINED),
+    DocumentStatus.QUARANTINED: 0,
+    DocumentStatus.FAILED: _status_mask(DocumentStatus.QUARANTINED),
+}
+
+
+def can_transition(current: Optional[str], target: DocumentStatus) -> bool:
+    """Check a stored status string against the workflow transition table."""
+    status = _ENUM_BY_VALUE[DocumentStatus].get(current)
+    return status is not None and status.can_transition_to(target)
+
+
+class MediaType(_LookupEnum):
     """Document media type."""
     DOCUMENT = "document"
     IMAGE = "image"
 
 
-class DocumentCategory(str, Enum):
+class DocumentCategory(_LookupEnum):
     """High-level document categories."""
     PROJECT_MANAGEMENT = "project_management"
     FINANCIAL = "financial"
@@ -49,7 +124,7 @@ class DocumentCategory(str, Enum):
     MISCELLANEOUS = "miscellaneous"
 
 
-class DocumentSubcategory(str, Enum):
+class DocumentSubcategory(_LookupEnum):
     """Document subcategories for more granular classification."""
     # Project Management subcategories
     PLANNING = "planning"
@@ -94,7 +169,7 @@ class DocumentSubcategory(str, Enum):
     REFERENCE = "reference"
 
 
-class DocType(str, Enum):
+class DocType(_LookupEnum):
     """Document type classification."""
     # Project Management Documents
     SOW = "sow"  # Statement of Work
@@ -147,6 +222,80 @@ class DocType(str, Enum):
     FORM = "form"  # Forms and templates
 
 
+# Interned value -> member tables backing _LookupEnum.from_str
+_ENUM_BY_VALUE: Dict[type, Dict[str, _LookupEnum]] = {
+    enum_cls: {sys.intern(member.value): member for member in enum_cls}
+    for enum_cls in (DocumentStatus, MediaType, DocumentCategory, DocumentSubcategory, DocType)
+}
+
+# Interned enum values for string membership checks on request/Firestore data
+DOC_TYPE_VALUES = frozenset(sys.intern(member.value) for member in DocType)
+DOCUMENT_CATEGORY_VALUES = frozenset(sys.intern(member.value) for member in DocumentCategory)
+DOCUMENT_SUBCATEGORY_VALUES = frozenset(sys.intern(member.value) for member in DocumentSubcategory)
+
+
+# Document AI output is passed through as-is: every key is optional and keys
+# not declared here are kept rather than dropped on validation
+_PASSTHROUGH_CONFIG = ConfigDict(extra="allow")
+
+
+class PageDimension(TypedDict, total=False):
+    """Page size reported by Document AI."""
+    __pydantic_config__ = _PASSTHROUGH_CONFIG
+    width: float
+    height: float
+
+
+class ProcessedPage(TypedDict, total=False):
+    """Per-page text extracted by Document AI."""
+    __pydantic_config__ = _PASSTHROUGH_CONFIG
+    page_number: int
+    text: str
+    dimension: PageDimension
+
+
+class ProcessedEntity(TypedDict, total=False):
+    """Entity extracted by Document AI."""
+    __pydantic_config__ = _PASSTHROUGH_CONFIG
+    type: str
+    mention_text: str
+    confidence: float
+
+
+class TableCell(TypedDict, total=False):
+    """Table cell text extracted by Document AI."""
+    __pydantic_config__ = _PASSTHROUGH_CONFIG
+    text: str
+    confidence: float
+
+
+class ProcessedTable(TypedDict, total=False):
+    """Table extracted by Document AI."""
+    __pydantic_config__ = _PASSTHROUGH_CONFIG
+    rows: int
+    columns: int
+    cells: List[TableCell]
+
+
+class ProcessingResult(TypedDict, total=False):
+    """Processing output stored on a document.
+    
+    Document AI keys come from DocumentAIClient.process_document; ``chunks``
+    and ``vector_ids`` are recorded by the workers that vectorize the text.
+    Keys from other producers are kept as-is.
+    """
+    __pydantic_config__ = _PASSTHROUGH_CONFIG
+    text: str
+    pages: List[ProcessedPage]
+    entities: List[ProcessedEntity]
+    tables: List[ProcessedTable]
+    confidence: float
+    page_count: int
+    error: str
+    chunks: int
+    vector_ids: List[str]
+
+
 class DLPFindings(BaseModel):
     """DLP scan findings."""
     status: str = Field(..., description="DLP scan status")
@@ -160,18 +309,25 @@ class EmbeddingInfo(BaseModel):
 
 class ClassificationInfo(BaseModel):
     """Document classification information."""
+    model_config = ConfigDict(defer_build=True)
+    
     doc_type: DocType = Field(..., description="Primary document type")
     category: DocumentCategory = Field(..., description="Document category")
     subcategory: Optional[DocumentSubcategory] = Field(None, description="Document subcategory")
     confidence_score: float = Field(..., description="Classification confidence (0.0-1.0)", ge=0.0, le=1.0)
     classification_method: str = Field(..., description="Method used for classification")
-    alternative_types: List[Dict[str, Any]] = Field(default_factory=list, description="Alternative classifications with scores")
-    keywords: List[str] = Field(default_factory=list, description="Keywords that influenced classification")
+    alternative_types: Tuple[Dict[str, Any], ...] = Field(default=(), description="Alternative classifications with scores")
+    keywords: Tuple[str, ...] = Field(default=(), description="Keywords that influenced classification")
     last_classified_at: Optional[datetime] = Field(None, description="When classification was last updated")
 
 
 class DocumentMetadata(BaseModel):
-    """Document metadata stored in Firestore."""
+    """Document metadata stored in Firestore.
+    
+    Instances are immutable; use ``model_copy(update=...)`` to change fields.
+    """
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore")
+    
     id: str = Field(..., description="Unique document identifier")
     title: str = Field(..., description="Document title")
     type: str = Field(..., description="Document type (PDF, DOCX, etc.)")
@@ -179,7 +335,7 @@ class DocumentMetadata(BaseModel):
     uri: str = Field(..., description="GCS URI for document file")
     status: str = Field(..., description="Processing status")
     upload_date: Optional[str] = Field(None, description="Upload date")
-    processing_result: Optional[Dict[str, Any]] = Field(None, description="Document AI processing results")
+    processing_result: Optional[ProcessingResult] = Field(None, description="Document AI processing results")
     
     # Optional fields for full implementation
     media_type: Optional[MediaType] = Field(None, description="Document media type")
@@ -188,11 +344,11 @@ class DocumentMetadata(BaseModel):
     source_uri: Optional[str] = Field(None, description="Source URI (original document link, etc.)")
     required_fields_ok: bool = Field(default=True, description="Required fields validation")
     dlp_scan: Optional[DLPFindings] = Field(None, description="DLP scan results")
-    thumbnails: List[str] = Field(default_factory=list, description="GCS URIs for thumbnails (images only)")
+    thumbnails: Tuple[str, ...] = Field(default=(), description="GCS URIs for thumbnails (images only)")
     embeddings: Optional[EmbeddingInfo] = Field(None, description="Embedding information")
     created_by: Optional[str] = Field(None, description="Creator email")
-    approved_by: List[str] = Field(default_factory=list, description="Approver emails")
-    topics: List[str] = Field(default_factory=list, description="Document topics/tags")
+    approved_by: Tuple[str, ...] = Field(default=(), description="Approver emails")
+    topics: Tuple[str, ...] = Field(default=(), description="Document topics/tags")
     created_at: Optional[datetime] = Field(None, description="Creation timestamp")
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
     
@@ -247,11 +403,148 @@ class DocumentMetadata(BaseModel):
     team_can_download: bool = Field(default=False, description="Whether project team can download original file")
     gcs_copy_uri: Optional[str] = Field(None, description="GCS URI for team-accessible copy (read-only)")
     original_file_downloaded: bool = Field(default=False, description="Whether original file copied to GCS for team access")
+    
+    @classmethod
+    def from_firestore(cls, data: Dict[str, Any]) -> "DocumentMetadata":
+        """Build from a trusted Firestore document without running validation.
+        
+        Only use this for data this service wrote itself; HTTP ingress must keep
+        going through normal validation.
+        """
+        return _construct_trusted(cls, data)
+    
+    @classmethod
+    def rewrite(cls, raw: Dict[str, Any], *, drop: frozenset = frozenset()) -> Dict[str, Any]:
+        """Project a trusted Firestore dict straight to an API dict.
+        
+        Keeps only model fields (minus ``drop``) and unwraps enum values in a
+        single pass, without building a model instance.
+        """
+        field_names = _MODEL_FIELD_NAMES[cls]
+        return {
+            key: value.value if isinstance(value, Enum) else value
+            for key, value in raw.items()
+            if key in field_names and key not in drop
+        }
+    
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes], trusted: bool = False) -> "DocumentMetadata":
+        """Parse JSON with pydantic-core's native parser.
+        
+        Untrusted input is validated in a single native pass; trusted payloads
+        (e.g. Pub/Sub messages this service published) skip validation.
+        """
+        if trusted:
+            return _construct_trusted(cls, pydantic_core.from_json(raw))
+        return cls.model_validate_json(raw)
+    
+    @classmethod
+    def validate_many(cls, rows: List[Dict[str, Any]]) -> List["DocumentMetadata"]:
+        """Validate a batch of untrusted rows in a single pydantic-core call."""
+        return _list_adapter(cls).validate_python(rows)
+    
+    @classmethod
+    def validate_many_json(cls, raw: Union[str, bytes]) -> List["DocumentMetadata"]:
+        """Validate a JSON array of documents without a separate json.loads step."""
+        return _list_adapter(cls).validate_json(raw)
+    
+    @classmethod
+    def iter_validate(cls, rows: Iterable[Dict[str, Any]]) -> Iterator["DocumentMetadata"]:
+        """Validate rows one at a time, e.g. from a streaming source.
+        
+        The core validator is fetched once per batch and called directly,
+        bypassing ``BaseModel.__init__`` for each row.
+        """
+        validate = _core_validator(cls).validate_python
+        for row in rows:
+            yield validate(row)
 
 
 class Document(BaseModel):
     """Complete document with metadata and content."""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore")
+    
     metadata: DocumentMetadata = Field(..., description="Document metadata")
     content: Optional[str] = Field(None, description="Extracted text content")
     chunks: List[str] = Field(default_factory=list, description="Text chunks for embedding")
     vector_ids: List[str] = Field(default_factory=list, description="Vector search IDs")
+    
+    @classmethod
+    def from_firestore(cls, data: Dict[str, Any]) -> "Document":
+        """Build from trusted Firestore data without running validation."""
+        return _construct_trusted(cls, data)
+    
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes], trusted: bool = False) -> "Document":
+        """Parse JSON natively, skipping validation for trusted payloads."""
+        if trusted:
+            return _construct_trusted(cls, pydantic_core.from_json(raw))
+        return cls.model_validate_json(raw)
+
+
+# Nested model fields rebuilt by _construct_trusted, per model class
+_NESTED_MODEL_FIELDS: Dict[Type[BaseModel], tuple] = {
+    DocumentMetadata: (
+        ("dlp_scan", DLPFindings),
+        ("embeddings", EmbeddingInfo),
+        ("classification", ClassificationInfo),
+    ),
+    Document: (("metadata", DocumentMetadata),),
+}
+
+# Enum-typed fields coerced by _construct_trusted so serialization stays warning-free
+_ENUM_FIELDS: Dict[Type[BaseModel], tuple] = {
+    ClassificationInfo: (
+        ("doc_type", DocType),
+        ("category", DocumentCategory),
+        ("subcategory", DocumentSubcategory),
+    ),
+    DocumentMetadata: (
+        ("media_type", MediaType),
+        ("doc_type", DocType),
+    ),
+}
+
+# Known field names per model, so extra Firestore keys are dropped cheaply
+_MODEL_FIELD_NAMES: Dict[Type[BaseModel], frozenset] = {
+    model_cls: frozenset(model_cls.model_fields)
+    for model_cls in (DLPFindings, EmbeddingInfo, ClassificationInfo, DocumentMetadata, Document)
+}
+
+
+def _construct_trusted(model_cls: Type[_ModelT], data: Dict[str, Any]) -> _ModelT:
+    """Recursively model_construct a model and its nested models, skipping validation."""
+    field_names = _MODEL_FIELD_NAMES[model_cls]
+    values = {key: value for key, value in data.items() if key in field_names}
+    
+    for field_name, nested_cls in _NESTED_MODEL_FIELDS.get(model_cls, ()):
+        nested = values.get(field_name)
+        if isinstance(nested, dict):
+            values[field_name] = _construct_trusted(nested_cls, nested)
+    
+    for field_name, enum_cls in _ENUM_FIELDS.get(model_cls, ()):
+        raw = values.get(field_name)
+        if raw is not None and not isinstance(raw, enum_cls):
+            # Legacy values outside the enum keep the stored string
+            values[field_name] = _ENUM_BY_VALUE[enum_cls].get(raw, raw)
+    
+    return model_cls.model_construct(**values)
+
+
+def _core_validator(model_cls: Type[BaseModel]) -> SchemaValidator:
+    """Get a model's core validator, building a deferred schema if needed."""
+    if not model_cls.__pydantic_complete__:
+        model_cls.model_rebuild()
+    return model_cls.__pydantic_validator__
+
+
+# list[Model] adapters, built on first use so deferred schemas stay deferred
+_LIST_ADAPTERS: Dict[Type[BaseModel], TypeAdapter] = {}
+
+
+def _list_adapter(model_cls: Type[_ModelT]) -> TypeAdapter:
+    """Get the cached TypeAdapter for a list of the given model."""
+    adapter = _LIST_ADAPTERS.get(model_cls)
+    if adapter is None:
+        adapter = _LIST_ADAPTERS[model_cls] = TypeAdapter(List[model_cls])
+    return adapter
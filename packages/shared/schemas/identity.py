@@ -1,10 +1,14 @@
 """Identity abstraction layer for marketplace-level IAM integration."""
 
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime
 
+from packages.shared.request_clock import request_now
+
 
 class IdentityProvider(str, Enum):
     """Identity provider types."""
@@ -18,6 +22,7 @@ class IdentityProvider(str, Enum):
 
 class ExternalIdentity(BaseModel):
     """Reference to user identity in external IAM system."""
+    model_config = ConfigDict(defer_build=True)
     
     # External identity
     external_user_id: str = Field(..., description="User ID in external system")
@@ -41,6 +46,7 @@ class ExternalIdentity(BaseModel):
 
 class LocalUserMapping(BaseModel):
     """Maps external user to Project Agent local user."""
+    model_config = ConfigDict(defer_build=True)
     
     # Local identity (Project Agent)
     local_user_id: str = Field(..., description="User ID in Project Agent")
@@ -65,31 +71,37 @@ class LocalUserMapping(BaseModel):
     )
 
 
-class MarketplaceContext(BaseModel):
-    """Context from marketplace-level IAM (future)."""
+@dataclass(frozen=True, slots=True)
+class MarketplaceContext:
+    """Context from marketplace-level IAM (future).
+    
+    A plain frozen dataclass: it is built once per token and only read
+    afterwards. Use ``parse_marketplace_context`` to validate raw input.
+    """
     
     # Marketplace identifiers
-    marketplace_user_id: str = Field(..., description="User ID in marketplace")
-    marketplace_org_id: str = Field(..., description="Organization ID in marketplace")
-    marketplace_subscription_id: Optional[str] = Field(None, description="Subscription ID")
+    marketplace_user_id: str  # User ID in marketplace
+    marketplace_org_id: str  # Organization ID in marketplace
+    marketplace_subscription_id: Optional[str] = None  # Subscription ID
     
     # Marketplace permissions
-    marketplace_roles: list[str] = Field(default_factory=list, description="Roles in marketplace")
-    marketplace_permissions: list[str] = Field(default_factory=list, description="Global permissions")
+    marketplace_roles: tuple[str, ...] = ()  # Roles in marketplace
+    marketplace_permissions: frozenset[str] = frozenset()  # Global permissions
     
-    # Product access
-    product_access: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Access levels for different products"
-    )
+    # Product access levels for different products
+    product_access: Dict[str, Any] = field(default_factory=dict)
     
     # Billing context
-    subscription_tier: Optional[str] = Field(None, description="Subscription tier (free/pro/enterprise)")
-    quota_limits: Optional[Dict[str, int]] = Field(None, description="Usage quotas")
+    subscription_tier: Optional[str] = None  # Subscription tier (free/pro/enterprise)
+    quota_limits: Optional[Dict[str, int]] = None  # Usage quotas
 
 
 class AuthContext(BaseModel):
-    """Unified auth context supporting both local and marketplace IAM."""
+    """Unified auth context supporting both local and marketplace IAM.
+    
+    Helpers that inspect an AuthContext live in ``identity_ops``.
+    """
+    model_config = ConfigDict(defer_build=True)
     
     # Core identity
     user_id: str = Field(..., description="User ID (local or external)")
@@ -102,8 +114,8 @@ class AuthContext(BaseModel):
     
     # Project Agent context (local)
     local_role: Optional[str] = Field(None, description="Role in Project Agent")
-    local_client_ids: list[str] = Field(default_factory=list, description="Accessible clients")
-    local_project_ids: list[str] = Field(default_factory=list, description="Accessible projects")
+    local_client_ids: tuple[str, ...] = Field(default=(), description="Accessible clients")
+    local_project_ids: tuple[str, ...] = Field(default=(), description="Accessible projects")
     
     # Marketplace context (future)
     marketplace_context: Optional[MarketplaceContext] = Field(
@@ -113,60 +125,47 @@ class AuthContext(BaseModel):
     
     # Session
     session_id: Optional[str] = Field(None, description="Session identifier")
-    issued_at: datetime = Field(default_factory=datetime.now)
+    issued_at: datetime = Field(default_factory=request_now)
     expires_at: Optional[datetime] = Field(None, description="Token expiration")
-    
-    def is_from_marketplace(self) -> bool:
-        """Check if user is from marketplace IAM."""
-        return self.identity_provider == IdentityProvider.MARKETPLACE
-    
-    def get_effective_role(self) -> str:
-        """Get effective role considering both local and marketplace."""
-        # Future: Combine local role with marketplace permissions
-        return self.local_role or "end_user"
-    
-    def has_marketplace_permission(self, permission: str) -> bool:
-        """Check if user has a marketplace-level permission."""
-        if not self.marketplace_context:
-            return False
-        return permission in self.marketplace_context.marketplace_permissions
 
 
-class IAMConfig(BaseModel):
-    """Configuration for IAM integration."""
+@dataclass(frozen=True, slots=True)
+class IAMConfig:
+    """Configuration for IAM integration.
+    
+    Loaded once and read on every auth decision; use ``parse_iam_config``
+    to validate raw configuration.
+    """
     
     # Current provider
-    primary_identity_provider: IdentityProvider = Field(
-        default=IdentityProvider.LOCAL,
-        description="Primary identity provider"
-    )
+    primary_identity_provider: IdentityProvider = IdentityProvider.LOCAL
     
     # Federation settings
-    enable_marketplace_federation: bool = Field(
-        default=False,
-        description="Enable marketplace IAM federation"
-    )
-    marketplace_iam_endpoint: Optional[str] = Field(
-        None,
-        description="Marketplace IAM API endpoint"
-    )
-    marketplace_client_id: Optional[str] = Field(
-        None,
-        description="Client ID for marketplace integration"
-    )
+    enable_marketplace_federation: bool = False
+    marketplace_iam_endpoint: Optional[str] = None  # Marketplace IAM API endpoint
+    marketplace_client_id: Optional[str] = None  # Client ID for marketplace integration
     
     # SSO settings
-    enable_sso: bool = Field(default=False, description="Enable SSO")
-    sso_provider: Optional[IdentityProvider] = Field(None, description="SSO provider")
-    sso_metadata_url: Optional[str] = Field(None, description="SSO metadata URL")
+    enable_sso: bool = False
+    sso_provider: Optional[IdentityProvider] = None
+    sso_metadata_url: Optional[str] = None
     
-    # Auto-provisioning
-    auto_provision_users: bool = Field(
-        default=True,
-        description="Auto-create users on first login from external IAM"
-    )
-    default_role_for_new_users: str = Field(
-        default="end_user",
-        description="Default role for auto-provisioned users"
-    )
+    # Auto-provisioning: create users on first login from external IAM
+    auto_provision_users: bool = True
+    default_role_for_new_users: str = "end_user"
+
+
+@lru_cache(maxsize=None)
+def _adapter(target: type) -> TypeAdapter:
+    """Build the validating adapter for a dataclass on first use."""
+    return TypeAdapter(target)
+
+
+def parse_marketplace_context(data: Dict[str, Any]) -> MarketplaceContext:
+    """Validate raw marketplace data into a MarketplaceContext."""
+    return _adapter(MarketplaceContext).validate_python(data)
+
 
+def parse_iam_config(data: Dict[str, Any]) -> IAMConfig:
+    """Validate raw configuration into an IAMConfig."""
+    return _adapter(IAMConfig).validate_python(data)
@@ -1,10 +1,14 @@
 """Identity mapping for parent-child IAM relationship with marketplace."""
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from types import MappingProxyType
+from typing import Optional, Dict, List, Literal, Mapping, Tuple, Union
+import pydantic_core
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from enum import Enum
 
+from packages.shared.request_clock import request_now
+
 
 class MarketplaceRole(str, Enum):
     """Roles defined by marketplace/portal IAM (parent system)."""
@@ -42,12 +46,17 @@ class RoleMapping(BaseModel):
     )
 
 
-# Default role mapping from marketplace to Project Agent
-DEFAULT_ROLE_MAPPING: Dict[MarketplaceRole, ProductRole] = {
+# Default role mapping from marketplace to Project Agent (read-only)
+DEFAULT_ROLE_MAPPING: Mapping[MarketplaceRole, ProductRole] = MappingProxyType({
     MarketplaceRole.PLATFORM_ADMIN: ProductRole.SUPER_ADMIN,
     MarketplaceRole.ORG_ADMIN: ProductRole.ACCOUNT_ADMIN,
     MarketplaceRole.ORG_USER: ProductRole.END_USER,
     MarketplaceRole.ORG_VIEWER: ProductRole.END_USER,
+})
+
+# Every marketplace role resolved up front, so lookups never need a fallback
+_ROLE_TABLE: Dict[MarketplaceRole, ProductRole] = {
+    role: DEFAULT_ROLE_MAPPING.get(role, ProductRole.END_USER) for role in MarketplaceRole
 }
 
 
@@ -72,12 +81,43 @@ class MarketplaceUserContext(BaseModel):
     
     # Token
     token: str = Field(..., description="JWT token from marketplace")
-    issued_at: datetime = Field(default_factory=datetime.now)
+    issued_at: datetime = Field(default_factory=request_now)
     expires_at: Optional[datetime] = Field(None, description="Token expiration")
+    
+    @classmethod
+    def from_jwt_payload_bytes(cls, data: Union[str, bytes], trusted: bool = False) -> "MarketplaceUserContext":
+        """Validate a verified JWT payload straight from its JSON bytes.
+        
+        Pass the decoded payload segment (after signature verification)
+        rather than ``json.loads`` output, so parsing and validation happen
+        in one pass. ISO timestamps in the payload are parsed natively.
+        
+        ``trusted=True`` is for claims whose signature has already been
+        verified: they are parsed with pydantic-core's native parser and
+        built with ``model_construct``. Keep the default for untrusted
+        ingress such as webhooks.
+        """
+        if not trusted:
+            return cls.model_validate_json(data)
+        
+        values = pydantic_core.from_json(data)
+        role = values.get("marketplace_role")
+        if role is not None:
+            values["marketplace_role"] = MarketplaceRole(role)
+        for field_name in _DATETIME_FIELDS:
+            raw = values.get(field_name)
+            if isinstance(raw, str):
+                values[field_name] = datetime.fromisoformat(raw)
+        return cls.model_construct(**values)
+
+
+# Timestamp claims converted on the trusted (unvalidated) payload path
+_DATETIME_FIELDS = ("issued_at", "expires_at")
 
 
 class ProjectAgentUserContext(BaseModel):
     """User context within Project Agent (child system)."""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore")
     
     # Local identity
     local_user_id: str = Field(..., description="User ID in Project Agent")
@@ -88,14 +128,14 @@ class ProjectAgentUserContext(BaseModel):
     
     # Role (derived from marketplace OR set locally)
     product_role: ProductRole = Field(..., description="Role in Project Agent")
-    role_source: str = Field(
+    role_source: Literal["marketplace", "local", "manual"] = Field(
         default="marketplace",
         description="Where role comes from: marketplace|local|manual"
     )
     
     # Product-specific access
-    client_ids: List[str] = Field(default_factory=list, description="Accessible clients")
-    project_ids: List[str] = Field(default_factory=list, description="Accessible projects")
+    client_ids: Tuple[str, ...] = Field(default=(), description="Accessible clients")
+    project_ids: Tuple[str, ...] = Field(default=(), description="Accessible projects")
     
     # Original marketplace context (if federated)
     marketplace_context: Optional[MarketplaceUserContext] = Field(
@@ -104,7 +144,7 @@ class ProjectAgentUserContext(BaseModel):
     )
     
     # Permissions
-    permissions: List[str] = Field(default_factory=list, description="Computed permissions")
+    permissions: Tuple[str, ...] = Field(default=(), description="Computed permissions")
     
     def get_effective_role(self) -> ProductRole:
         """Get effective role, preferring marketplace role if federated."""
@@ -112,9 +152,7 @@ class ProjectAgentUserContext(BaseModel):
     
     def can_access_project(self, project_id: str) -> bool:
         """Check if user can access a project."""
-        if self.product_role == ProductRole.SUPER_ADMIN:
-            return True
-        return project_id in self.project_ids
+        return self.product_role is ProductRole.SUPER_ADMIN or project_id in self.project_ids
 
 
 def map_marketplace_to_product_role(marketplace_role: MarketplaceRole) -> ProductRole:
@@ -123,7 +161,7 @@ def map_marketplace_to_product_role(marketplace_role: MarketplaceRole) -> Produc
     
     Marketplace determines the role, we just map it to our product-specific equivalent.
     """
-    return DEFAULT_ROLE_MAPPING.get(marketplace_role, ProductRole.END_USER)
+    return _ROLE_TABLE[marketplace_role]
 
 
 def create_project_agent_context(
@@ -136,26 +174,37 @@ def create_project_agent_context(
     Create Project Agent context from marketplace context.
     
     This is called when a federated user accesses Project Agent.
+    
+    Inputs must already be validated: ``marketplace_context`` is a
+    validated model and the ids come from our own database, so the
+    result is built with ``model_construct`` and skips re-validation.
     """
     # Map marketplace role to product role
     product_role = map_marketplace_to_product_role(marketplace_context.marketplace_role)
     
     # For platform admins, auto-grant access to everything
-    auto_grant_all = (marketplace_context.marketplace_role == MarketplaceRole.PLATFORM_ADMIN)
+    auto_grant_all = (marketplace_context.marketplace_role is MarketplaceRole.PLATFORM_ADMIN)
     
-    return ProjectAgentUserContext(
+    return ProjectAgentUserContext.model_construct(
         local_user_id=local_user_id,
         marketplace_user_id=marketplace_context.marketplace_user_id,
         is_federated=True,
         product_role=product_role,
         role_source="marketplace",  # Role came from marketplace
-        client_ids=client_ids if not auto_grant_all else [],  # Empty = all access for super admin
-        project_ids=project_ids if not auto_grant_all else [],
+        client_ids=tuple(client_ids) if not auto_grant_all else (),  # Empty = all access for super admin
+        project_ids=tuple(project_ids) if not auto_grant_all else (),
         marketplace_context=marketplace_context,
-        permissions=[]  # TODO: Compute based on role
+        permissions=()  # TODO: Compute based on role
     )
 
 
+class ProductContext(BaseModel):
+    """Product-specific metadata the marketplace sends; unknown keys are dropped."""
+    model_config = ConfigDict(extra="ignore")
+    
+    org_name: str = Field(default="", description="Organization name")
+
+
 class ChildIAMInterface(BaseModel):
     """
     Interface that Project Agent exposes to parent marketplace IAM.
@@ -171,11 +220,16 @@ class ChildIAMInterface(BaseModel):
     role: str = Field(..., description="Role in marketplace (platform_admin|org_admin|org_user|org_viewer)")
     
     # Product-specific context (marketplace may send this)
-    product_context: Optional[Dict[str, Any]] = Field(
+    product_context: Optional[ProductContext] = Field(
         None,
         description="Product-specific metadata from marketplace"
     )
     
+    @classmethod
+    def from_payload_bytes(cls, data: Union[str, bytes]) -> "ChildIAMInterface":
+        """Validate a marketplace payload straight from its JSON bytes."""
+        return cls.model_validate_json(data)
+    
     # What Project Agent does with it
     def to_marketplace_context(self) -> MarketplaceUserContext:
         """Convert to marketplace context."""
@@ -184,7 +238,7 @@ class ChildIAMInterface(BaseModel):
             email=self.email,
             name=self.name,
             marketplace_org_id=self.org_id,
-            org_name=self.product_context.get('org_name', '') if self.product_context else '',
+            org_name=self.product_context.org_name if self.product_context else '',
             marketplace_role=MarketplaceRole(self.role),
             has_project_agent_access=True,  # If they got here, they have access
             token="",  # Populated by auth system
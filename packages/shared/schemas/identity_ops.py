@@ -0,0 +1,29 @@
+"""Helpers for inspecting an AuthContext.
+
+Kept as plain functions rather than AuthContext methods so per-request
+middleware checks are direct function calls.
+"""
+
+from .identity import AuthContext, IdentityProvider
+
+MARKETPLACE_PROVIDER = IdentityProvider.MARKETPLACE
+DEFAULT_EFFECTIVE_ROLE = "end_user"
+
+
+def is_from_marketplace(ctx: AuthContext) -> bool:
+    """Check if user is from marketplace IAM."""
+    return ctx.identity_provider is MARKETPLACE_PROVIDER
+
+
+def get_effective_role(ctx: AuthContext) -> str:
+    """Get effective role considering both local and marketplace."""
+    # Future: Combine local role with marketplace permissions
+    return ctx.local_role or DEFAULT_EFFECTIVE_ROLE
+
+
+def has_marketplace_permission(ctx: AuthContext, permission: str) -> bool:
+    """Check if user has a marketplace-level permission."""
+    marketplace_context = ctx.marketplace_context
+    if marketplace_context is None:
+        return False
+    return permission in marketplace_context.marketplace_permissions
@@ -1,7 +1,8 @@
 """Inventory API schemas."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import NotRequired, TypedDict
 from .document import DocType, MediaType, DocumentStatus
 
 
@@ -24,23 +25,38 @@ class InventoryRequest(BaseModel):
     sort_order: str = Field(default="desc", description="Sort order (asc/desc)")
 
 
-class InventoryItem(BaseModel):
-    """Inventory item summary."""
-    doc_id: str = Field(..., description="Document ID")
-    title: str = Field(..., description="Document title")
-    doc_type: DocType = Field(..., description="Document type")
-    media_type: MediaType = Field(..., description="Media type")
-    status: DocumentStatus = Field(..., description="Processing status")
-    created_by: str = Field(..., description="Creator")
-    created_at: str = Field(..., description="Creation date")
-    topics: List[str] = Field(default_factory=list, description="Topics")
-    thumbnail: Optional[str] = Field(None, description="Thumbnail URL")
+class InventoryItem(TypedDict):
+    """Inventory item summary.
+    
+    Built internally from Firestore reads on every listing request, so it is
+    a plain dict rather than a model; validate at the API boundary with
+    ``INVENTORY_ITEMS_ADAPTER`` when needed.
+    """
+    doc_id: str  # Document ID
+    title: str  # Document title
+    doc_type: DocType  # Document type
+    media_type: MediaType  # Media type
+    status: DocumentStatus  # Processing status
+    created_by: str  # Creator
+    created_at: str  # Creation date
+    topics: NotRequired[List[str]]  # Topics
+    thumbnail: NotRequired[Optional[str]]  # Thumbnail URL
+
+
+class InventoryResponse(TypedDict):
+    """Inventory API response."""
+    items: List[InventoryItem]  # Inventory items
+    total: int  # Total items matching filters
+    page: int  # Current page
+    page_size: int  # Items per page
+    total_pages: int  # Total pages
 
 
-class InventoryResponse(BaseModel):
-    """Inventory API response."""
-    items: List[InventoryItem] = Field(..., description="Inventory items")
-    total: int = Field(..., description="Total items matching filters")
-    page: int = Field(..., description="Current page")
-    page_size: int = Field(..., description="Items per page")
-    total_pages: int = Field(..., description="Total pages")
+# Built once at import; reuse instead of constructing per request
+INVENTORY_ITEMS_ADAPTER: TypeAdapter = TypeAdapter(List[InventoryItem])
+_RESPONSE_ADAPTER: TypeAdapter = TypeAdapter(InventoryResponse)
+
+
+def dump_inventory_response(resp: InventoryResponse) -> bytes:
+    """Serialize an inventory response to JSON with the shared adapter."""
+    return _RESPONSE_ADAPTER.dump_json(resp)
@@ -1,8 +1,11 @@
 """Role-Based Access Control (RBAC) schemas for multi-tenant system."""
 
+import re
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field, EmailStr
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, FrozenSet, Iterable, List, Literal, Mapping, Optional, Tuple, Union
+from pydantic import BaseModel, Discriminator, Field, PlainSerializer, Tag, TypeAdapter, computed_field
 from datetime import datetime
 
 
@@ -38,18 +41,55 @@ class PermissionType(str, Enum):
     DOWNLOAD_DOCUMENTS = "download_documents"
 
 
+# Emails are plain str on the models (they are re-read from Firestore on
+# every lookup); submitted addresses are checked once with is_valid_email
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def is_valid_email(value: str) -> bool:
+    """Cheap syntactic email check for ingress points."""
+    return _EMAIL_RE.match(value) is not None
+
+
+# Declaration order, used to store permission sets as stable lists
+_PERMISSION_ORDER = {perm: index for index, perm in enumerate(PermissionType)}
+_EMPTY_FROZENSET: FrozenSet[PermissionType] = frozenset()
+
+# One bit per permission, so a permission set is a single int
+_PERM_BITS = {perm: 1 << index for index, perm in enumerate(PermissionType)}
+
+
+def permission_mask(perms: Iterable[PermissionType]) -> int:
+    """Fold permissions into a bitmask checkable with a single ``&``."""
+    mask = 0
+    for perm in perms:
+        mask |= _PERM_BITS[perm]
+    return mask
+
+
+def _permissions_to_list(perms: FrozenSet[PermissionType]) -> List[PermissionType]:
+    return sorted(perms, key=_PERMISSION_ORDER.__getitem__)
+
+
+# Frozenset for O(1) membership checks; dumped as an ordered list for Firestore
+PermissionSet = Annotated[
+    FrozenSet[PermissionType],
+    PlainSerializer(_permissions_to_list, return_type=List[PermissionType]),
+]
+
+
 class Client(BaseModel):
     """Client/Organization entity."""
     id: str = Field(..., description="Unique client identifier")
     name: str = Field(..., description="Client organization name")
     domain: Optional[str] = Field(None, description="Email domain for automatic assignment")
-    status: str = Field(default="active", description="Client status (active/inactive)")
+    status: Literal["active", "inactive"] = Field(default="active", description="Client status (active/inactive)")
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     created_by: str = Field(..., description="Email of creator")
     
     # Metadata
-    contact_email: Optional[EmailStr] = Field(None, description="Primary contact email")
+    contact_email: Optional[str] = Field(None, description="Primary contact email")
     contact_name: Optional[str] = Field(None, description="Primary contact name")
     industry: Optional[str] = Field(None, description="Client industry")
     notes: Optional[str] = Field(None, description="Additional notes")
@@ -61,7 +101,7 @@ class Project(BaseModel):
     client_id: str = Field(..., description="Parent client ID")
     name: str = Field(..., description="Project name")
     code: Optional[str] = Field(None, description="Project code/abbreviation")
-    status: str = Field(default="active", description="Project status (active/archived/completed)")
+    status: Literal["active", "archived", "completed"] = Field(default="active", description="Project status (active/archived/completed)")
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     created_by: str = Field(..., description="Email of creator")
@@ -70,7 +110,7 @@ class Project(BaseModel):
     start_date: Optional[datetime] = Field(None, description="Project start date")
     end_date: Optional[datetime] = Field(None, description="Project end date")
     description: Optional[str] = Field(None, description="Project description")
-    tags: List[str] = Field(default_factory=list, description="Project tags")
+    tags: Tuple[str, ...] = Field(default=(), description="Project tags")
     
     # Document index
     document_index_url: Optional[str] = Field(None, description="Google Sheets index URL")
@@ -80,16 +120,16 @@ class Project(BaseModel):
 class UserProfile(BaseModel):
     """User profile with role and access assignments."""
     id: str = Field(..., description="Unique user identifier")
-    email: EmailStr = Field(..., description="User email address")
+    email: str = Field(..., description="User email address")
     name: str = Field(..., description="User full name")
     role: UserRole = Field(..., description="User role")
-    status: str = Field(default="active", description="User status (active/inactive/suspended)")
+    status: Literal["active", "inactive", "suspended"] = Field(default="active", description="User status (active/inactive/suspended)")
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     
     # Access assignments
-    client_ids: List[str] = Field(default_factory=list, description="Assigned client IDs")
-    project_ids: List[str] = Field(default_factory=list, description="Assigned project IDs")
+    client_ids: Tuple[str, ...] = Field(default=(), description="Assigned client IDs")
+    project_ids: Tuple[str, ...] = Field(default=(), description="Assigned project IDs")
     
     # Metadata
     phone: Optional[str] = Field(None, description="Phone number")
@@ -104,9 +144,15 @@ class UserClientAssignment(BaseModel):
     user_id: str = Field(..., description="User ID")
     client_id: str = Field(..., description="Client ID")
     role: UserRole = Field(..., description="User's role within this client")
-    permissions: List[PermissionType] = Field(default_factory=list, description="Specific permissions")
+    permissions: PermissionSet = Field(default_factory=frozenset, description="Specific permissions")
     created_at: datetime = Field(default_factory=datetime.now)
     created_by: str = Field(..., description="Who created this assignment")
+    
+    @computed_field
+    @property
+    def perm_mask(self) -> int:
+        """Bitmask of ``permissions``, stored alongside them for one-``&`` checks."""
+        return permission_mask(self.permissions)
 
 
 class UserProjectAssignment(BaseModel):
@@ -115,16 +161,22 @@ class UserProjectAssignment(BaseModel):
     user_id: str = Field(..., description="User ID")
     project_id: str = Field(..., description="Project ID")
     role: UserRole = Field(..., description="User's role within this project")
-    permissions: List[PermissionType] = Field(default_factory=list, description="Specific permissions")
+    permissions: PermissionSet = Field(default_factory=frozenset, description="Specific permissions")
     created_at: datetime = Field(default_factory=datetime.now)
     created_by: str = Field(..., description="Who created this assignment")
+    
+    @computed_field
+    @property
+    def perm_mask(self) -> int:
+        """Bitmask of ``permissions``, stored alongside them for one-``&`` checks."""
+        return permission_mask(self.permissions)
 
 
 class AccessRequest(BaseModel):
     """User request for access to client or project."""
     id: str = Field(..., description="Unique request identifier")
     user_id: str = Field(..., description="Requesting user ID")
-    user_email: EmailStr = Field(..., description="Requesting user email")
+    user_email: str = Field(..., description="Requesting user email")
     
     # What they're requesting
     client_id: Optional[str] = Field(None, description="Client ID (if requesting client access)")
@@ -133,7 +185,7 @@ class AccessRequest(BaseModel):
     
     # Request details
     reason: Optional[str] = Field(None, description="Reason for access request")
-    status: str = Field(default="pending", description="Request status (pending/approved/denied)")
+    status: Literal["pending", "approved", "denied"] = Field(default="pending", description="Request status (pending/approved/denied)")
     
     # Tracking
     requested_at: datetime = Field(default_factory=datetime.now)
@@ -142,9 +194,61 @@ class AccessRequest(BaseModel):
     review_notes: Optional[str] = Field(None, description="Review notes/reason")
 
 
+class ClientAccessRequest(AccessRequest):
+    """User request for access to a client."""
+    request_scope: Literal["client"] = Field(default="client", description="Request scope tag")
+    client_id: str = Field(..., description="Client ID being requested")
+
+
+class ProjectAccessRequest(AccessRequest):
+    """User request for access to a project."""
+    request_scope: Literal["project"] = Field(default="project", description="Request scope tag")
+    project_id: str = Field(..., description="Project ID being requested")
+
+
+def _access_request_scope(data: Any) -> Optional[str]:
+    """Return the request_scope tag, inferring it for untagged stored requests."""
+    if isinstance(data, dict):
+        scope = data.get("request_scope")
+        if scope is None:
+            # Requests stored before the tag existed carry only one of the ids
+            if data.get("project_id"):
+                scope = "project"
+            elif data.get("client_id"):
+                scope = "client"
+        return scope
+    return getattr(data, "request_scope", None)
+
+
+# Client or project access request, dispatched on request_scope
+ScopedAccessRequest = Annotated[
+    Union[
+        Annotated[ClientAccessRequest, Tag("client")],
+        Annotated[ProjectAccessRequest, Tag("project")],
+    ],
+    Discriminator(_access_request_scope),
+]
+
+
+@lru_cache(maxsize=None)
+def _access_request_adapter() -> TypeAdapter:
+    """Build the ScopedAccessRequest union adapter on first use."""
+    return TypeAdapter(ScopedAccessRequest)
+
+
+def parse_access_request(data: Dict[str, Any]) -> Union[ClientAccessRequest, ProjectAccessRequest]:
+    """Validate a stored or submitted access request into its scoped model.
+
+    Payloads without ``request_scope`` are scoped by whichever of
+    ``project_id`` or ``client_id`` they carry.
+    """
+    return _access_request_adapter().validate_python(data)
+
+
 # Permission mapping by role
-ROLE_PERMISSIONS = {
-    UserRole.SUPER_ADMIN: [
+# Read-only view so call sites can share it without defensive copies
+ROLE_PERMISSIONS: Mapping[UserRole, FrozenSet[PermissionType]] = MappingProxyType({
+    UserRole.SUPER_ADMIN: frozenset({
         PermissionType.MANAGE_CLIENTS,
         PermissionType.MANAGE_USERS,
         PermissionType.MANAGE_SYSTEM,
@@ -158,16 +262,16 @@ ROLE_PERMISSIONS = {
         PermissionType.VIEW_DOCUMENTS,
         PermissionType.CHAT_WITH_DOCUMENTS,
         PermissionType.DOWNLOAD_DOCUMENTS,
-    ],
-    UserRole.ACCOUNT_ADMIN: [
+    }),
+    UserRole.ACCOUNT_ADMIN: frozenset({
         PermissionType.VIEW_CLIENT,
         PermissionType.MANAGE_USERS,  # Within their client only
         PermissionType.MANAGE_PROJECTS,  # Within their client only
         PermissionType.VIEW_PROJECT,
         PermissionType.VIEW_DOCUMENTS,
         PermissionType.CHAT_WITH_DOCUMENTS,
-    ],
-    UserRole.PROJECT_ADMIN: [
+    }),
+    UserRole.PROJECT_ADMIN: frozenset({
         PermissionType.VIEW_PROJECT,
         PermissionType.MANAGE_DOCUMENTS,  # Within their project only
         PermissionType.UPLOAD_DOCUMENTS,
@@ -176,21 +280,26 @@ ROLE_PERMISSIONS = {
         PermissionType.VIEW_DOCUMENTS,
         PermissionType.CHAT_WITH_DOCUMENTS,
         PermissionType.DOWNLOAD_DOCUMENTS,
-    ],
-    UserRole.END_USER: [
+    }),
+    UserRole.END_USER: frozenset({
         PermissionType.VIEW_PROJECT,
         PermissionType.VIEW_DOCUMENTS,
         PermissionType.CHAT_WITH_DOCUMENTS,
-    ],
-}
+    }),
+})
+
 
+# Per-role permission bitmasks for has_permission
+_ROLE_MASK: Mapping[UserRole, int] = MappingProxyType({
+    role: permission_mask(perms) for role, perms in ROLE_PERMISSIONS.items()
+})
 
-def get_role_permissions(role: UserRole) -> List[PermissionType]:
+
+def get_role_permissions(role: UserRole) -> FrozenSet[PermissionType]:
     """Get all permissions for a given role."""
-    return ROLE_PERMISSIONS.get(role, [])
+    return ROLE_PERMISSIONS.get(role, _EMPTY_FROZENSET)
 
 
 def has_permission(user_role: UserRole, required_permission: PermissionType) -> bool:
     """Check if a role has a specific permission."""
-    return required_permission in ROLE_PERMISSIONS.get(user_role, [])
-
+    return bool(_ROLE_MASK.get(user_role, 0) & _PERM_BITS[required_permission])
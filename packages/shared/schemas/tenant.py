@@ -1,43 +1,29 @@
 """Multi-tenancy schemas for client and project isolation."""
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import FrozenSet, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
+from typing_extensions import NotRequired, TypedDict
 from datetime import datetime
 from packages.shared.schemas.rbac import UserRole
 
 
-class TenantContext(BaseModel):
-    """Context for tenant isolation in requests."""
-    user_id: str = Field(..., description="Current user ID")
-    user_email: str = Field(..., description="Current user email")
-    user_role: str = Field(..., description="Current user role")
+class TenantContext(TypedDict):
+    """Context for tenant isolation in requests.
     
-    # Access scope
-    client_ids: List[str] = Field(default_factory=list, description="Accessible client IDs")
-    project_ids: List[str] = Field(default_factory=list, description="Accessible project IDs")
+    Built from trusted user records on every request; access checks live in
+    ``tenant_ops``.
+    """
+    user_id: str  # Current user ID
+    user_email: str  # Current user email
+    user_role: UserRole  # Current user role
+    
+    # Access scope, as sets for O(1) access checks
+    client_ids: FrozenSet[str]  # Accessible client IDs
+    project_ids: FrozenSet[str]  # Accessible project IDs
     
     # Current context
-    active_client_id: Optional[str] = Field(None, description="Currently selected client")
-    active_project_id: Optional[str] = Field(None, description="Currently selected project")
-    
-    def can_access_client(self, client_id: str) -> bool:
-        """Check if user can access a specific client."""
-        return client_id in self.client_ids or self.user_role == "super_admin"
-    
-    def can_access_project(self, project_id: str) -> bool:
-        """Check if user can access a specific project."""
-        return project_id in self.project_ids or self.user_role == "super_admin"
-    
-    def get_accessible_clients(self) -> List[str]:
-        """Get list of accessible client IDs."""
-        return self.client_ids
-    
-    def get_accessible_projects(self, client_id: Optional[str] = None) -> List[str]:
-        """Get list of accessible project IDs, optionally filtered by client."""
-        if client_id:
-            # In real implementation, filter projects by client_id
-            return self.project_ids
-        return self.project_ids
+    active_client_id: NotRequired[Optional[str]]  # Currently selected client
+    active_project_id: NotRequired[Optional[str]]  # Currently selected project
 
 
 class ClientSettings(BaseModel):
@@ -50,7 +36,7 @@ class ClientSettings(BaseModel):
     secondary_color: Optional[str] = Field(None, description="Secondary brand color")
     
     # Features
-    features_enabled: List[str] = Field(default_factory=list, description="Enabled features")
+    features_enabled: Tuple[str, ...] = Field(default=(), description="Enabled features")
     max_documents: Optional[int] = Field(None, description="Maximum documents allowed")
     max_storage_gb: Optional[int] = Field(None, description="Maximum storage in GB")
     
@@ -60,7 +46,7 @@ class ClientSettings(BaseModel):
     
     # Security
     require_2fa: bool = Field(default=False, description="Require two-factor authentication")
-    allowed_ip_ranges: List[str] = Field(default_factory=list, description="Allowed IP ranges")
+    allowed_ip_ranges: Tuple[str, ...] = Field(default=(), description="Allowed IP ranges")
     session_timeout_minutes: int = Field(default=480, description="Session timeout in minutes")
 
 
@@ -71,8 +57,8 @@ class ProjectSettings(BaseModel):
     # Document settings
     auto_approve_documents: bool = Field(default=False, description="Auto-approve uploaded documents")
     require_metadata_validation: bool = Field(default=True, description="Require complete metadata")
-    allowed_document_types: List[str] = Field(
-        default_factory=lambda: ["sow", "timeline", "deliverable", "misc"],
+    allowed_document_types: Tuple[str, ...] = Field(
+        default=("sow", "timeline", "deliverable", "misc"),
         description="Allowed document types"
     )
     
@@ -87,6 +73,8 @@ class ProjectSettings(BaseModel):
 
 class AuditLog(BaseModel):
     """Audit log entry for tracking all actions."""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore")
+    
     id: str = Field(..., description="Unique log entry ID")
     timestamp: datetime = Field(default_factory=datetime.now)
     
@@ -106,8 +94,9 @@ class AuditLog(BaseModel):
     
     # Details
     action_description: str = Field(..., description="Human-readable description")
-    changes: Optional[Dict[str, Any]] = Field(None, description="What changed (before/after)")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    # Write-only audit payloads: stored as given, never walked by the validator
+    changes: Optional[SkipValidation[Dict[str, Any]]] = Field(None, description="What changed (before/after)")
+    metadata: Optional[SkipValidation[Dict[str, Any]]] = Field(None, description="Additional metadata")
     
     # Security
     ip_address: Optional[str] = Field(None, description="User IP address")
@@ -118,6 +107,8 @@ class AuditLog(BaseModel):
 
 class DocumentAccess(BaseModel):
     """Document access record linking documents to projects and users."""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore")
+    
     id: str = Field(..., description="Unique access record ID")
     document_id: str = Field(..., description="Document ID")
     project_id: str = Field(..., description="Project ID")
@@ -130,12 +121,12 @@ class DocumentAccess(BaseModel):
     )
     
     # Access control
-    allowed_user_ids: List[str] = Field(
-        default_factory=list,
+    allowed_user_ids: Tuple[str, ...] = Field(
+        default=(),
         description="Specific users who can access (empty = all project users)"
     )
-    allowed_roles: List[UserRole] = Field(
-        default_factory=list,
+    allowed_roles: Tuple[UserRole, ...] = Field(
+        default=(),
         description="Roles that can access (empty = all project users)"
     )
     
@@ -0,0 +1,32 @@
+"""Helpers for checking access against a TenantContext.
+
+Kept as plain functions so the context itself stays a plain dict.
+"""
+
+from typing import FrozenSet, Optional
+
+from .rbac import UserRole
+from .tenant import TenantContext
+
+SUPER_ADMIN_ROLE = UserRole.SUPER_ADMIN
+
+
+def can_access_client(ctx: TenantContext, client_id: str) -> bool:
+    """Check if user can access a specific client."""
+    return ctx["user_role"] is SUPER_ADMIN_ROLE or client_id in ctx["client_ids"]
+
+
+def can_access_project(ctx: TenantContext, project_id: str) -> bool:
+    """Check if user can access a specific project."""
+    return ctx["user_role"] is SUPER_ADMIN_ROLE or project_id in ctx["project_ids"]
+
+
+def get_accessible_clients(ctx: TenantContext) -> FrozenSet[str]:
+    """Get the set of accessible client IDs."""
+    return ctx["client_ids"]
+
+
+def get_accessible_projects(ctx: TenantContext, client_id: Optional[str] = None) -> FrozenSet[str]:
+    """Get the set of accessible project IDs, optionally filtered by client."""
+    # In real implementation, filter projects by client_id
+    return ctx["project_ids"]
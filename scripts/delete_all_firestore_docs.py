@@ -7,19 +7,63 @@ Usage:
     
 This script will:
 1. Connect to Firestore
-2. List all documents in the 'documents' collection
-3. Delete them one by one
+2. Count the documents in the 'documents' collection
+3. Page through them and delete in bulk with a BulkWriter (or a thread
+   pool on older clients)
 4. Show progress and final count
 """
 
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from google.api_core.exceptions import ResourceExhausted
 from google.cloud import firestore
 from datetime import datetime
 
+# Documents fetched per page; only one page of snapshots is held at a time
+PAGE_SIZE = 500
+
+# Thread-pool fallback for clients without BulkWriter
+DELETE_WORKERS = 32
+MAX_RETRIES = 5
+
+# Minimum seconds between progress line refreshes
+PROGRESS_INTERVAL = 0.5
+
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+def _iter_reference_pages(docs_ref):
+    """Yield document references one page at a time.
+    
+    The empty projection fetches references only, and paging keeps memory
+    bounded by PAGE_SIZE snapshots regardless of collection size.
+    """
+    query = docs_ref.select([]).limit(PAGE_SIZE)
+    while True:
+        snaps = list(query.stream())
+        if not snaps:
+            return
+        
+        yield [doc.reference for doc in snaps]
+        
+        query = docs_ref.select([]).start_after(snaps[-1]).limit(PAGE_SIZE)
+
+
+def _delete_with_retry(reference):
+    """Delete one document, backing off while Firestore is throttling us."""
+    for attempt in range(MAX_RETRIES):
+        try:
+            reference.delete()
+            return
+        except ResourceExhausted:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            time.sleep(0.1 * (2 ** attempt))
+
+
 def delete_all_documents():
     """Delete all documents from Firestore."""
     
@@ -40,15 +84,15 @@ def delete_all_documents():
         print("2. Or running on GCP with default credentials")
         return
     
-    # Get all documents
-    print("\n📝 Fetching all documents...")
+    # Count documents
+    print("\n📝 Counting documents...")
     try:
         docs_ref = db.collection("documents")
-        docs = list(docs_ref.stream())
-        total_count = len(docs)
+        # Server-side count aggregation instead of downloading the collection
+        total_count = docs_ref.count().get()[0][0].value
         print(f"✅ Found {total_count} documents")
     except Exception as e:
-        print(f"❌ Failed to fetch documents: {e}")
+        print(f"❌ Failed to count documents: {e}")
         return
     
     if total_count == 0:
@@ -65,26 +109,61 @@ def delete_all_documents():
     
     # Delete documents
     print(f"\n🗑️  Deleting {total_count} documents...")
-    deleted_count = 0
-    failed_count = 0
+    counts = {"deleted": 0, "failed": 0}
+    failures = []
+    last_print = [time.monotonic()]
+    counts_lock = threading.Lock()  # Updated from worker threads
     
-    for i, doc in enumerate(docs, 1):
-        try:
-            doc_id = doc.id
-            doc_data = doc.to_dict()
-            title = doc_data.get("title", "Untitled")
-            
-            # Delete the document
-            doc.reference.delete()
-            deleted_count += 1
+    def record(doc_id, error=None):
+        with counts_lock:
+            if error is None:
+                counts["deleted"] += 1
+            else:
+                counts["failed"] += 1
+                failures.append((doc_id, error))
+            done = counts["deleted"] + counts["failed"]
             
-            # Show progress every 10 documents
-            if i % 10 == 0 or i == total_count:
-                print(f"  Progress: {i}/{total_count} ({i*100//total_count}%)")
-            
-        except Exception as e:
-            failed_count += 1
-            print(f"  ❌ Failed to delete {doc_id}: {e}")
+            # Refresh the progress line at most every PROGRESS_INTERVAL seconds
+            now = time.monotonic()
+            if now - last_print[0] < PROGRESS_INTERVAL:
+                return
+            last_print[0] = now
+        
+        sys.stdout.write(f"\r  Progress: {done}/{total_count} ({done*100//total_count}%)")
+    
+    def on_error(error, writer):
+        record(error.operation.reference.id, error.message)
+        return False  # Do not retry
+    
+    if hasattr(db, "bulk_writer"):
+        # BulkWriter batches and parallelizes deletes instead of one RPC per document
+        bulk_writer = db.bulk_writer()
+        bulk_writer.on_write_result(lambda reference, result, writer: record(reference.id))
+        bulk_writer.on_write_error(on_error)
+        
+        for references in _iter_reference_pages(docs_ref):
+            for reference in references:
+                bulk_writer.delete(reference)
+        
+        bulk_writer.close()
+    else:
+        # Older clients without BulkWriter: overlap the per-document RPCs
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            for references in _iter_reference_pages(docs_ref):
+                futures = {executor.submit(_delete_with_retry, ref): ref.id for ref in references}
+                for future in as_completed(futures):
+                    error = future.exception()
+                    record(futures[future], error)
+    
+    deleted_count = counts["deleted"]
+    failed_count = counts["failed"]
+    
+    done = deleted_count + failed_count
+    sys.stdout.write(f"\r  Progress: {done}/{total_count} ({done*100//total_count}%)\n")
+    sys.stdout.flush()
+    
+    for doc_id, error in failures:
+        print(f"  ❌ Failed to delete {doc_id}: {error}")
     
     # Summary
     print("\n" + "=" * 60)
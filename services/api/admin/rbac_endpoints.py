@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
 
 from packages.shared.clients.auth import require_admin_auth
+from packages.shared.schemas.rbac import is_valid_email
 from google.cloud import firestore
 
 router = APIRouter(prefix="/admin/rbac", tags=["RBAC"])
@@ -27,6 +28,13 @@ async def create_client(
     Create a new client. Requires MANAGE_CLIENTS permission.
     Only Super Admins can create clients.
     """
+    contact_email = client_data.get("contact_email")
+    if contact_email and not is_valid_email(contact_email):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid contact email: {contact_email}"
+        )
+    
     try:
         client = Client(
             id=client_data.get("id", f"client-{client_data['name'].lower().replace(' ', '-')}"),
@@ -34,7 +42,7 @@ async def create_client(
             domain=client_data.get("domain"),
             status=client_data.get("status", "active"),
             created_by=current_user["email"],
-            contact_email=client_data.get("contact_email"),
+            contact_email=contact_email,
             contact_name=client_data.get("contact_name"),
             industry=client_data.get("industry"),
             notes=client_data.get("notes")
@@ -330,6 +338,12 @@ async def create_user(
                     detail="Cannot assign user to clients you don't have access to"
                 )
         
+        if not is_valid_email(user_data["email"]):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid email: {user_data['email']}"
+            )
+        
         user = UserProfile(
             id=user_data.get("id", f"user-{user_data['email'].split('@')[0]}"),
             email=user_data["email"],
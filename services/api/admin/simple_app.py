@@ -2,6 +2,7 @@
 
 import csv
 import io
+import logging
 import re
 import requests
 from typing import List, Dict, Any, Optional
@@ -9,6 +10,8 @@ from datetime import datetime
 from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="Project Agent Admin API",
     description="Administrative operations for document ingestion and management",
@@ -136,6 +139,10 @@ def extract_gid_from_url(url: str) -> Optional[str]:
 
 def is_google_drive_url(url: str) -> bool:
     """Check if URL is a Google Drive URL."""
+    # Substring pre-check rejects non-Google hosts without entering the regex engine
+    if "google.com" not in url:
+        return False
+    
     drive_patterns = [
         r'drive\.google\.com',
         r'docs\.google\.com',
@@ -150,6 +157,9 @@ def is_google_drive_url(url: str) -> bool:
 
 def extract_drive_file_id(url: str) -> Optional[str]:
     """Extract Google Drive file ID from various Google URLs."""
+    if "google.com" not in url:
+        return None
+    
     patterns = [
         r'/file/d/([a-zA-Z0-9-_]+)',
         r'/document/d/([a-zA-Z0-9-_]+)',
@@ -244,8 +254,9 @@ def parse_google_sheets_csv(sheet_id: str, gid: Optional[str] = None) -> List[Di
         
         # Parse CSV content
         csv_content = response.text
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
-        rows = list(csv_reader)
+        csv_reader = csv.reader(io.StringIO(csv_content))
+        header = next(csv_reader, [])
+        rows = [dict(zip(header, values)) for values in csv_reader if values]
         
         return rows
     except HTTPException:
@@ -512,28 +523,30 @@ async def ingest_csv(
                 detail="File must be a CSV"
             )
         
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        
-        # Parse CSV
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
-        documents = list(csv_reader)
-        
-        processed_count = 0
-        for doc_data in documents:
-            try:
-                await ingest_link({
-                    "title": doc_data.get("title", ""),
-                    "doc_type": doc_data.get("doc_type", ""),
-                    "source_uri": doc_data.get("source_uri", ""),
-                    "tags": doc_data.get("tags", "").split(",") if doc_data.get("tags") else [],
-                    "owner": doc_data.get("owner", "admin@transparent.partners"),
-                    "version": doc_data.get("version", "1.0")
-                }, user)
-                processed_count += 1
-            except Exception as e:
-                print(f"Failed to process document {doc_data.get('title', 'unknown')}: {e}")
-                continue
+        # Decode and parse the spooled upload as a stream; no full-file bytes or str copy.
+        # Non-UTF-8 exports (Latin-1, cp1252) decode with replacement characters instead of failing
+        text_stream = io.TextIOWrapper(file.file, encoding='utf-8', errors='replace', newline='')
+        try:
+            csv_reader = csv.DictReader(text_stream)
+            
+            processed_count = 0
+            for doc_data in csv_reader:
+                try:
+                    await ingest_link({
+                        "title": doc_data.get("title", ""),
+                        "doc_type": doc_data.get("doc_type", ""),
+                        "source_uri": doc_data.get("source_uri", ""),
+                        "tags": doc_data.get("tags", "").split(",") if doc_data.get("tags") else [],
+                        "owner": doc_data.get("owner", "admin@transparent.partners"),
+                        "version": doc_data.get("version", "1.0")
+                    }, user)
+                    processed_count += 1
+                except Exception as e:
+                    logger.error("Failed to process document %s: %s", doc_data.get('title', 'unknown'), e)
+                    continue
+        finally:
+            # Leave the underlying upload file open for FastAPI to clean up
+            text_stream.detach()
         
         return {
             "ok": True,
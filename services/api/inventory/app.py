@@ -89,13 +89,13 @@ async def get_inventory(
         end_idx = start_idx + page_size
         paginated_docs = accessible_docs[start_idx:end_idx]
         
-        return InventoryResponse(
-            items=paginated_docs,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=(total + page_size - 1) // page_size
-        )
+        return {
+            "items": paginated_docs,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size
+        }
         
     except Exception as e:
         raise HTTPException(
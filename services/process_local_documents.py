@@ -162,8 +162,10 @@ class LocalDocumentProcessor:
                         print(f"   ✅ Indexed chunk {i+1}/{len(text_chunks)}")
             
             # Update document with vector IDs
-            doc_metadata.status = "indexed"
-            doc_metadata.__dict__['vector_ids'] = vector_ids
+            doc_metadata = doc_metadata.model_copy(update={
+                "status": "indexed",
+                "processing_result": {**processing_result, "vector_ids": vector_ids}
+            })
             await self.firestore_client.save_document(doc_metadata)
             
             print(f"🎉 Document processing completed!")
@@ -0,0 +1,34 @@
+"""Test the demo admin API's CSV ingest."""
+
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+# Add the admin service directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), 'api', 'admin'))
+
+import simple_app
+
+client = TestClient(simple_app.app)
+
+
+def _post_csv(content: bytes):
+    return client.post("/admin/ingest/csv", files={"file": ("index.csv", content, "text/csv")})
+
+
+def test_ingest_csv_accepts_utf8():
+    response = _post_csv("title,doc_type,source_uri\nProject plan,sow,\n".encode("utf-8"))
+    assert response.status_code == 200
+    assert response.json()["count"] == 1
+
+
+def test_ingest_csv_accepts_cp1252_upload():
+    response = _post_csv("title,doc_type,source_uri\nCafé rollout,sow,\n".encode("cp1252"))
+    assert response.status_code == 200
+    assert response.json()["count"] == 1
+
+
+def test_ingest_csv_rejects_non_csv_filename():
+    response = client.post("/admin/ingest/csv", files={"file": ("index.txt", b"title\n", "text/plain")})
+    assert response.status_code == 400
@@ -0,0 +1,35 @@
+"""Test text chunking for embeddings."""
+
+import os
+import sys
+
+import pytest
+
+# Add the parent directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from packages.shared.clients.vector_search import VectorSearchClient
+
+
+@pytest.fixture(scope="module")
+def client():
+    return VectorSearchClient()
+
+
+@pytest.mark.parametrize("text", ["", "   ", "\n\t "])
+def test_chunk_text_returns_no_chunks_for_blank_text(client, text):
+    assert client.chunk_text(text) == []
+
+
+def test_chunk_text_strips_short_text(client):
+    assert client.chunk_text("  Project plan \n") == ["Project plan"]
+
+
+def test_chunk_text_splits_long_text_into_bounded_chunks(client):
+    text = " ".join(f"word{i}" for i in range(200))
+    chunks = client.chunk_text(text, chunk_size=100, overlap=20)
+    assert len(chunks) > 1
+    assert all(chunk and chunk == chunk.strip() for chunk in chunks)
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert chunks[0].startswith("word0 ")
+    assert chunks[-1].endswith("199")
@@ -0,0 +1,25 @@
+"""Test shared settings."""
+
+import os
+import sys
+
+# Add the parent directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from packages.shared.config import Settings
+
+
+def test_cors_origins_default_to_project_and_region():
+    settings = Settings(gcp_project="demo-project", region="europe-west1")
+    assert "https://project-agent-web-demo-project.europe-west1.run.app" in settings.cors_origins
+    assert "http://localhost:3000" in settings.cors_origins
+
+
+def test_explicit_empty_cors_origins_are_kept(monkeypatch):
+    monkeypatch.setenv("CORS_ORIGINS", "[]")
+    assert Settings().cors_origins == []
+
+
+def test_explicit_cors_origins_are_kept():
+    settings = Settings(cors_origins=["https://example.com"])
+    assert settings.cors_origins == ["https://example.com"]
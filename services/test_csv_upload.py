@@ -0,0 +1,123 @@
+"""Test CSV upload parsing and validation."""
+
+import gzip
+import io
+import os
+import sys
+
+import pytest
+from fastapi import HTTPException
+
+# Add the parent directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from packages.shared import csv_upload
+from packages.shared.csv_upload import detect_csv_encoding, open_csv_upload
+
+HEADER = "title,doc_type,source_uri,owner\n"
+
+
+def _parse(content: bytes, **kwargs):
+    """Payloads and row count for an upload, detaching the text stream afterwards."""
+    text_stream, payloads, row_count = open_csv_upload(io.BytesIO(content), **kwargs)
+    try:
+        return list(payloads), row_count
+    finally:
+        text_stream.detach()
+
+
+def test_detect_csv_encoding():
+    assert detect_csv_encoding(b"title\n", complete=True) == "utf-8"
+    assert detect_csv_encoding(b"\xef\xbb\xbftitle\n", complete=True) == "utf-8-sig"
+    assert detect_csv_encoding("title\nCafé plan\n".encode("cp1252"), complete=True) != "utf-8"
+
+
+def test_detect_csv_encoding_allows_character_cut_at_sample_end():
+    sample = "title\nCafé".encode("utf-8")[:-1]
+    assert detect_csv_encoding(sample, complete=False) == "utf-8"
+
+
+def test_open_csv_upload_builds_payloads():
+    payloads, row_count = _parse((HEADER + "Plan,sow,https://example.com/plan,\n").encode())
+    assert row_count == 1
+    assert payloads[0]["title"] == "Plan"
+    assert payloads[0]["source_uri"] == "https://example.com/plan"
+    assert payloads[0]["version"] == "1.0"
+
+
+def test_open_csv_upload_decodes_cp1252():
+    payloads, _ = _parse((HEADER + "Café plan,sow,,\n").encode("cp1252"))
+    assert payloads[0]["title"] == "Café plan"
+
+
+def test_open_csv_upload_accepts_ragged_rows_and_skips_blank_lines():
+    payloads, row_count = _parse((HEADER + "Plan,sow\n\nBrief,misc,,owner@example.com,extra\n").encode())
+    assert row_count == 2
+    assert payloads[0]["source_uri"] == ""
+    assert payloads[0]["owner"] == "admin@transparent.partners"
+    assert payloads[1]["owner"] == "owner@example.com"
+
+
+def test_open_csv_upload_rejects_missing_columns():
+    with pytest.raises(HTTPException) as exc_info:
+        _parse(b"title,doc_type\nPlan,sow\n")
+    assert exc_info.value.status_code == 400
+    assert "source_uri" in exc_info.value.detail
+
+
+def test_open_csv_upload_reports_rows_missing_required_cells():
+    with pytest.raises(HTTPException) as exc_info:
+        _parse((HEADER + "Plan,sow,,\n,misc,,\n").encode())
+    assert exc_info.value.status_code == 400
+    assert "Row 2: missing title" in exc_info.value.detail
+
+
+def test_fast_path_matches_csv_reader_for_unquoted_rows():
+    content = (HEADER + "Plan,sow,https://example.com/plan,\nBrief,misc\n").encode()
+    assert _parse(content, fast=True) == _parse(content)
+
+
+def test_fast_path_rejects_quoted_fields():
+    with pytest.raises(HTTPException) as exc_info:
+        _parse((HEADER + '"Plan, v2",sow,,\n').encode(), fast=True)
+    assert exc_info.value.status_code == 400
+    assert "quoted field" in exc_info.value.detail
+
+
+def test_open_csv_upload_gunzips_compressed_uploads():
+    content = (HEADER + "Plan,sow,,\n").encode()
+    assert _parse(gzip.compress(content), compressed=True) == _parse(content)
+
+
+def test_open_csv_upload_rejects_invalid_gzip():
+    with pytest.raises(HTTPException) as exc_info:
+        _parse(b"not gzip at all", compressed=True)
+    assert exc_info.value.status_code == 400
+
+
+def test_open_csv_upload_bounds_decompressed_size(monkeypatch):
+    monkeypatch.setattr(csv_upload, "MAX_CSV_SIZE", 64 * 1024)
+    content = (HEADER + "Plan,sow,,\n" * 20_000).encode()
+    compressed = gzip.compress(content)
+    assert len(compressed) < csv_upload.MAX_CSV_SIZE < len(content)
+    with pytest.raises(HTTPException) as exc_info:
+        _parse(compressed, compressed=True)
+    assert exc_info.value.status_code == 413
+
+
+def test_open_csv_upload_rejects_oversized_upload(monkeypatch):
+    monkeypatch.setattr(csv_upload, "MAX_CSV_SIZE", 16)
+    with pytest.raises(HTTPException) as exc_info:
+        _parse((HEADER + "Plan,sow,,\n").encode())
+    assert exc_info.value.status_code == 413
+
+
+def test_pyarrow_path_matches_csv_reader_including_ragged_rows(monkeypatch):
+    pytest.importorskip("pyarrow")
+    rows = "".join(f"Doc {i},sow,https://example.com/{i},owner{i}\n" for i in range(50))
+    content = (HEADER + rows + "Short,misc\n" + rows).encode()
+    expected = _parse(content)
+    monkeypatch.setattr(csv_upload, "CSV_ARROW_MIN_SIZE", 0)
+    # Small blocks so some batches are read before the ragged row fails
+    monkeypatch.setattr(csv_upload, "CSV_ARROW_BLOCK_SIZE", 512)
+    assert _parse(content) == expected
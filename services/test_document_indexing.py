@@ -161,9 +161,9 @@ async def test_document_indexing_pipeline():
         
         # Step 6: Update document status
         print("\n6. Updating Document Status...")
-        doc_metadata.processing_result = processing_result
-        doc_metadata.status = "indexed"
-        doc_metadata.__dict__['vector_ids'] = vector_ids  # Add vector IDs
+        doc_metadata = doc_metadata.model_copy(
+            update={"processing_result": {**processing_result, "vector_ids": vector_ids}, "status": "indexed"}
+        )
         
         await firestore_client.save_document(doc_metadata)
         print(f"✅ Document status updated to 'indexed'")
@@ -0,0 +1,74 @@
+"""Test document schema validation."""
+
+import os
+import sys
+
+# Add the parent directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from packages.shared.schemas.document import DocumentMetadata, DocumentStatus, can_transition
+
+BASE_DOCUMENT = {
+    "id": "doc-1",
+    "title": "Statement of Work",
+    "type": "PDF",
+    "size": 1024,
+    "uri": "gs://bucket/doc-1.pdf",
+    "status": "uploaded",
+}
+
+
+def test_document_ids_are_not_pattern_constrained():
+    document = DocumentMetadata(
+        **{**BASE_DOCUMENT, "id": "doc 1.pdf"},
+        drive_file_id="folder/file:1",
+        access_request_id="req.1",
+    )
+    assert document.id == "doc 1.pdf"
+    assert document.drive_file_id == "folder/file:1"
+    assert document.access_request_id == "req.1"
+
+
+def test_indexed_is_its_own_status():
+    assert DocumentStatus.INDEXED.value == "indexed"
+    assert DocumentStatus.INDEXED is not DocumentStatus.PROCESSED
+    assert DocumentStatus.from_str("indexed") is DocumentStatus.INDEXED
+
+
+def test_status_values_are_unique():
+    values = [status.value for status in DocumentStatus]
+    assert len(values) == len(set(values))
+
+
+def test_processing_can_finish_as_processed_indexed_or_failed():
+    assert can_transition("processing", DocumentStatus.PROCESSED)
+    assert can_transition("processing", DocumentStatus.INDEXED)
+    assert can_transition("processing", DocumentStatus.FAILED)
+    assert not can_transition("processing", DocumentStatus.APPROVED)
+
+
+def test_can_transition_rejects_unknown_and_missing_statuses():
+    assert not can_transition("not-a-status", DocumentStatus.APPROVED)
+    assert not can_transition(None, DocumentStatus.APPROVED)
+    assert not can_transition("quarantined", DocumentStatus.APPROVED)
+
+
+def test_processing_result_keeps_undeclared_keys():
+    processing_result = {
+        "text": "Scope of work",
+        "chunks": 2,
+        "vector_ids": ["v1", "v2"],
+        "language": "en",
+    }
+    document = DocumentMetadata(**BASE_DOCUMENT, processing_result=processing_result)
+    assert document.processing_result == processing_result
+
+
+def test_processing_result_accepts_partial_document_ai_output():
+    processing_result = {
+        "pages": [{"page_number": 1}],
+        "entities": [{"type": "organization"}],
+        "tables": [{"rows": 1, "cells": [{"text": "Total", "layout": {"x": 0}}]}],
+    }
+    document = DocumentMetadata(**BASE_DOCUMENT, processing_result=processing_result)
+    assert document.processing_result == processing_result
@@ -0,0 +1,47 @@
+"""Test exception to HTTP status mapping."""
+
+import os
+import sys
+
+# Add the parent directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from packages.shared.exceptions import (
+    AuthorizationError,
+    DocumentNotFoundError,
+    StorageError,
+    handle_exception,
+)
+
+
+class ArchivedDocumentError(DocumentNotFoundError):
+    """Subclass with no entry of its own in the status map."""
+
+
+def test_mapped_exception_uses_its_status():
+    exc = handle_exception(AuthorizationError("nope", {"project_id": "p1"}))
+    assert exc.status_code == 403
+    assert exc.detail == {
+        "error": "authorization_failed",
+        "message": "nope",
+        "details": {"project_id": "p1"},
+    }
+
+
+def test_storage_error_is_internal():
+    exc = handle_exception(StorageError("bucket unavailable"))
+    assert exc.status_code == 500
+    assert exc.detail["error"] == "internal_error"
+
+
+def test_subclass_falls_back_to_nearest_mapped_base():
+    exc = handle_exception(ArchivedDocumentError("doc-1 archived"))
+    assert exc.status_code == 404
+    assert exc.detail["error"] == "document_not_found"
+
+
+def test_unknown_exception_is_unexpected_error():
+    exc = handle_exception(KeyError("id"))
+    assert exc.status_code == 500
+    assert exc.detail["error"] == "unknown_error"
+    assert exc.detail["details"] == {"exception_type": "KeyError"}
@@ -0,0 +1,83 @@
+"""Test RBAC schema parsing and permission checks."""
+
+import os
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+# Add the parent directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from packages.shared.schemas.rbac import (
+    ROLE_PERMISSIONS,
+    AccessRequest,
+    ClientAccessRequest,
+    PermissionType,
+    ProjectAccessRequest,
+    UserClientAssignment,
+    UserRole,
+    has_permission,
+    parse_access_request,
+    permission_mask,
+)
+
+BASE_REQUEST = {
+    "id": "req-1",
+    "user_id": "user-1",
+    "user_email": "user@example.com",
+    "requested_role": "end_user",
+}
+
+
+def test_parse_access_request_uses_scope_tag():
+    request = parse_access_request({**BASE_REQUEST, "request_scope": "project", "project_id": "p1"})
+    assert isinstance(request, ProjectAccessRequest)
+    assert request.project_id == "p1"
+
+
+def test_parse_access_request_infers_scope_for_untagged_client_request():
+    request = parse_access_request({**BASE_REQUEST, "client_id": "c1"})
+    assert isinstance(request, ClientAccessRequest)
+    assert request.request_scope == "client"
+
+
+def test_parse_access_request_prefers_project_when_both_ids_present():
+    request = parse_access_request({**BASE_REQUEST, "client_id": "c1", "project_id": "p1"})
+    assert isinstance(request, ProjectAccessRequest)
+    assert request.client_id == "c1"
+
+
+def test_parse_access_request_rejects_request_without_scope_or_ids():
+    with pytest.raises(ValidationError):
+        parse_access_request(BASE_REQUEST)
+
+
+def test_access_request_model_is_still_constructible():
+    request = AccessRequest(**BASE_REQUEST, client_id="c1")
+    assert request.client_id == "c1"
+    assert request.project_id is None
+
+
+def test_permission_mask_sets_one_bit_per_permission():
+    assert permission_mask([]) == 0
+    masks = [permission_mask([perm]) for perm in PermissionType]
+    assert all(mask and mask & (mask - 1) == 0 for mask in masks)
+    assert len(set(masks)) == len(masks)
+    assert permission_mask(PermissionType) == sum(masks)
+
+
+@pytest.mark.parametrize("role", list(UserRole))
+def test_has_permission_matches_role_permissions(role):
+    for perm in PermissionType:
+        assert has_permission(role, perm) == (perm in ROLE_PERMISSIONS[role])
+
+
+def test_assignment_perm_mask_matches_permissions():
+    perms = frozenset({PermissionType.VIEW_CLIENT, PermissionType.MANAGE_PROJECTS})
+    assignment = UserClientAssignment(
+        id="a1", user_id="user-1", client_id="c1", role=UserRole.ACCOUNT_ADMIN,
+        permissions=perms, created_by="admin@example.com",
+    )
+    assert assignment.perm_mask == permission_mask(perms)
+    assert assignment.model_dump()["perm_mask"] == assignment.perm_mask
@@ -116,13 +116,10 @@ class DocumentIndexingWorker:
                 
                 print(f"📤 Indexed chunk {i+1}/{len(text_chunks)}: {vector_id}")
             
-            # 6. Update document metadata with processing results
-            doc_metadata.processing_result = processing_result
-            doc_metadata.status = "indexed"
-            
-            # Add vector IDs to metadata (store in a custom field)
-            if not hasattr(doc_metadata, 'vector_ids'):
-                doc_metadata.__dict__['vector_ids'] = vector_ids
+            # 6. Update document metadata with processing results and vector IDs
+            doc_metadata = doc_metadata.model_copy(
+                update={"processing_result": {**processing_result, "vector_ids": vector_ids}, "status": "indexed"}
+            )
             
             await self.firestore_client.save_document(doc_metadata)
             
@@ -144,7 +141,7 @@ class DocumentIndexingWorker:
             try:
                 doc_metadata = await self.firestore_client.get_document(doc_id)
                 if doc_metadata:
-                    doc_metadata.status = "failed"
+                    doc_metadata = doc_metadata.model_copy(update={"status": "failed"})
                     await self.firestore_client.save_document(doc_metadata)
             except:
                 pass
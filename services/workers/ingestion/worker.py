@@ -180,9 +180,9 @@ class IngestionWorker:
                 # List files in Drive folder
                 files = await drive.list_files(folder_id, recursive=recursive)
                 
-                for file_info in files:
-                    # Create ingestion job for each file
-                    ingest_job = {
+                # Create ingestion job for each file and publish them as one batch
+                ingest_jobs = [
+                    {
                         "action": "link_ingest",
                         "title": file_info["name"],
                         "doc_type": self.infer_doc_type(file_info["name"]),
@@ -190,8 +190,10 @@ class IngestionWorker:
                         "created_by": initiated_by,
                         "tags": []
                     }
-                    
-                    await pubsub.publish_ingestion_job(ingest_job)
+                    for file_info in files
+                ]
+                
+                await pubsub.publish_ingestion_jobs_batch(ingest_jobs)
             
             # Audit sync completion
             await self.audit_success(job_data, f"synced {len(folder_ids)} folders")
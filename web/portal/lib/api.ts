@@ -60,11 +60,11 @@ export async function ingestDocument(data: {
 /**
  * Ingest multiple documents from CSV file
  */
-export async function ingestCSV(file: File): Promise<{ ok: boolean; count: number; message: string }> {
+export async function ingestCSV(file: File): Promise<{ ok: boolean; batch_id: string; count: number; message: string }> {
   const formData = new FormData()
   formData.append('file', file)
   
-  return apiClient.post<{ ok: boolean; count: number; message: string }>(
+  return apiClient.post<{ ok: boolean; batch_id: string; count: number; message: string }>(
     '/api/admin/ingest/csv', 
     formData,
     {
@@ -139,7 +139,6 @@ export async function getPendingDocuments(): Promise<{
 export async function deleteDocument(docId: string): Promise<{
   success: boolean
   doc_id: string
-  deleted_document: any
   message: string
 }> {
   return apiClient.delete<any>(`/api/admin/documents/${docId}`)
@@ -176,6 +175,7 @@ export async function analyzeDocumentIndex(data: {
 }): Promise<{
   success: boolean
   documents_created: number
+  documents_failed: number
   documents: Array<{
     id: string
     title: string